@@ -17,21 +17,41 @@ Options:
     --seed N          Random seed for reproducible behavior
     --verbose         Enable verbose logging
     --demo            Run a quick demonstration (20 iterations)
+    --state FILE      Resume from FILE and save the state there on exit
 """
 
-import argparse
+import asyncio
 import logging
 import sys
 import os
+from typing import TYPE_CHECKING
 
-# Add src to path for direct execution
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+if TYPE_CHECKING:
+    import argparse
 
-from src.lethe import Lethe
-from src.capabilities import register_default_capabilities
 
+_BANNER = """
+╔══════════════════════════════════════════════════════════════════════════════╗
+║                                                                              ║
+║     ██╗     ███████╗████████╗██╗  ██╗███████╗                                ║
+║     ██║     ██╔════╝╚══██╔══╝██║  ██║██╔════╝                                ║
+║     ██║     █████╗     ██║   ███████║█████╗                                  ║
+║     ██║     ██╔══╝     ██║   ██╔══██║██╔══╝                                  ║
+║     ███████╗███████╗   ██║   ██║  ██║███████╗                                ║
+║     ╚══════╝╚══════╝   ╚═╝   ╚═╝  ╚═╝╚══════╝                                ║
+║                                                                              ║
+║                    A Self-Degrading Cognitive System                         ║
+║                                                                              ║
+║     "In Greek mythology, Lethe was the river of forgetfulness..."            ║
+║                                                                              ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+"""
 
-def parse_args() -> argparse.Namespace:
+# The banner never changes, so encode it once rather than on every print
+_BANNER_BYTES = (_BANNER + "\n").encode("utf-8")
+
+
+def parse_args() -> "argparse.Namespace":
     """Parse command line arguments.
 
     Parses and validates command line arguments for configuring the Lethe
@@ -45,10 +65,14 @@ def parse_args() -> argparse.Namespace:
             - decay_prob: Probability of decay per interval (0.0-1.0)
             - loop_interval: Seconds between main loop iterations
             - narrative_interval: Seconds between narrative outputs
+            - narrative_prob: Fraction of scheduled narratives to emit
             - seed: Random seed for reproducibility
             - verbose: Whether to enable DEBUG logging
             - demo: Whether to run in demo mode
+            - state: File to resume from and save to, or None
     """
+    import argparse
+    
     parser = argparse.ArgumentParser(
         description="Lethe - A Self-Degrading Cognitive System",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -97,6 +121,19 @@ Examples:
         help="Seconds between narrative outputs (default: 10.0)"
     )
     
+    parser.add_argument(
+        "--narrative-prob",
+        type=float,
+        default=1.0,
+        help="Fraction of scheduled narratives to emit 0.0-1.0 (default: 1.0)"
+    )
+    
+    parser.add_argument(
+        "--state",
+        metavar="FILE",
+        help="Resume from FILE if it exists and save the state there on exit"
+    )
+    
     parser.add_argument(
         "--seed",
         type=int,
@@ -123,25 +160,16 @@ def print_banner() -> None:
     """Print the Lethe startup banner.
 
     Displays an ASCII art banner with the Lethe logo and tagline
-    to the console when the application starts.
+    to the console when the application starts. On a UTF-8 stdout the
+    pre-encoded bytes are written straight to the underlying buffer.
     """
-    banner = """
-╔══════════════════════════════════════════════════════════════════════════════╗
-║                                                                              ║
-║     ██╗     ███████╗████████╗██╗  ██╗███████╗                                ║
-║     ██║     ██╔════╝╚══██╔══╝██║  ██║██╔════╝                                ║
-║     ██║     █████╗     ██║   ███████║█████╗                                  ║
-║     ██║     ██╔══╝     ██║   ██╔══██║██╔══╝                                  ║
-║     ███████╗███████╗   ██║   ██║  ██║███████╗                                ║
-║     ╚══════╝╚══════╝   ╚═╝   ╚═╝  ╚═╝╚══════╝                                ║
-║                                                                              ║
-║                    A Self-Degrading Cognitive System                         ║
-║                                                                              ║
-║     "In Greek mythology, Lethe was the river of forgetfulness..."            ║
-║                                                                              ║
-╚══════════════════════════════════════════════════════════════════════════════╝
-"""
-    print(banner)
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is None or (sys.stdout.encoding or "").lower() not in ("utf-8", "utf8"):
+        print(_BANNER)
+        return
+    sys.stdout.flush()
+    buffer.write(_BANNER_BYTES)
+    buffer.flush()
 
 
 def run_demo() -> None:
@@ -155,6 +183,9 @@ def run_demo() -> None:
     including final health percentage, remaining capabilities, and
     total decay events.
     """
+    from src.lethe import Lethe
+    from src.capabilities import register_default_capabilities
+    
     print("\n" + "="*60)
     print("DEMO MODE: Running 20 fast iterations to demonstrate decay")
     print("="*60 + "\n")
@@ -173,13 +204,15 @@ def run_demo() -> None:
     
     # Initialize and run
     lethe.initialize()
+    lethe.flush_logs()
     
     print(f"Starting with {lethe.registry.capability_count()} capabilities\n")
     
-    lethe.run(max_iterations=20)
+    asyncio.run(lethe.run_async(max_iterations=20))
     
     # Print final status
     status = lethe.get_status()
+    lethe.flush_logs()
     print("\n" + "="*60)
     print("DEMO COMPLETE")
     print("="*60)
@@ -200,6 +233,13 @@ def main() -> int:
     Returns:
         int: Exit code (0 for success, 1 for error).
     """
+    # The demo uses a fixed configuration, so a bare --demo skips
+    # building the argument parser altogether
+    if sys.argv[1:] == ["--demo"]:
+        print_banner()
+        run_demo()
+        return 0
+    
     args = parse_args()
     
     # Print banner
@@ -210,6 +250,9 @@ def main() -> int:
         run_demo()
         return 0
     
+    from src.lethe import Lethe
+    from src.capabilities import register_default_capabilities
+    
     # Configure log level
     log_level = logging.DEBUG if args.verbose else logging.INFO
     
@@ -220,7 +263,8 @@ def main() -> int:
         loop_interval=args.loop_interval,
         narrative_interval=args.narrative_interval,
         seed=args.seed,
-        log_level=log_level
+        log_level=log_level,
+        narrative_probability=args.narrative_prob
     )
     
     # Register default capabilities
@@ -229,19 +273,31 @@ def main() -> int:
     # Initialize
     lethe.initialize()
     
+    if args.state and os.path.exists(args.state):
+        try:
+            lethe.load_state(args.state)
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logging.error(f"Could not load state from {args.state}, starting fresh: {e}")
+    
+    lethe.flush_logs()
     print(f"\nInitialized with {lethe.registry.capability_count()} capabilities")
     print(f"Decay interval: {args.decay_interval}s, Probability: {args.decay_prob}")
     print(f"Press Ctrl+C to stop\n")
     
     # Run main loop
     try:
-        lethe.run(max_iterations=args.iterations)
+        asyncio.run(lethe.run_async(max_iterations=args.iterations))
     except Exception as e:
         logging.error(f"Unexpected error: {e}")
         return 1
+    finally:
+        if args.state:
+            lethe.save_state(args.state)
     
     return 0
 
 
 if __name__ == "__main__":
+    # Add src to path for direct execution
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
     sys.exit(main())
@@ -6,42 +6,181 @@ the Lethe system's functionality. These capabilities represent various
 cognitive functions that will gradually degrade over time.
 """
 
+import functools
+import itertools
 import random
 import time
 import math
-from typing import List, Dict, Any, Optional
+from typing import Callable, List, Dict, Any, Optional
 
 from .capability import Importance
 from .lethe import Lethe
 
 
-def register_default_capabilities(lethe: Lethe, seed: Optional[int] = None) -> None:
-    """Register a comprehensive set of default capabilities with the Lethe system.
+# Default capability table, in registration order:
+# (name, importance, degradation_resistance, dependencies, description)
+_DEFAULT_CAPABILITIES = (
+    # ESSENTIAL - Cannot be degraded
+    ("heartbeat", Importance.ESSENTIAL, 1.0, (),
+     "Core heartbeat - proves the system is alive"),
+    ("self_awareness", Importance.ESSENTIAL, 1.0, (),
+     "Basic awareness that the system exists"),
+    
+    # CRITICAL - Strongly resist degradation
+    ("count", Importance.CRITICAL, 0.9, (),
+     "Ability to count and track numbers"),
+    ("time_sense", Importance.CRITICAL, 0.85, (),
+     "Awareness of time passage"),
+    ("basic_arithmetic", Importance.CRITICAL, 0.8, (),
+     "Basic mathematical operations"),
+    
+    # HIGH - Resist degradation
+    ("remember_name", Importance.HIGH, 0.7, (),
+     "Remember the system's own name"),
+    ("pattern_recognition", Importance.HIGH, 0.65, (),
+     "Recognize simple patterns"),
+    ("compare", Importance.HIGH, 0.6, (),
+     "Compare two values"),
+    ("list_management", Importance.HIGH, 0.55, (),
+     "Manage and manipulate lists"),
+    
+    # MEDIUM - Standard degradation resistance
+    ("generate_random", Importance.MEDIUM, 0.5, (),
+     "Generate random numbers"),
+    ("string_manipulation", Importance.MEDIUM, 0.45, (),
+     "Manipulate text strings"),
+    ("calculate_average", Importance.MEDIUM, 0.4, ("basic_arithmetic",),
+     "Calculate averages of number sets"),
+    ("sort_numbers", Importance.MEDIUM, 0.45, ("compare",),
+     "Sort lists of numbers"),
+    ("find_maximum", Importance.MEDIUM, 0.4, ("compare",),
+     "Find the maximum value"),
+    ("calculate_sum", Importance.MEDIUM, 0.4, ("basic_arithmetic",),
+     "Sum a list of numbers"),
+    
+    # LOW - Less resistant to degradation
+    ("joke_telling", Importance.LOW, 0.3, (),
+     "Tell simple jokes"),
+    ("rhyme_generation", Importance.LOW, 0.25, (),
+     "Generate simple rhymes"),
+    ("color_mixing", Importance.LOW, 0.3, (),
+     "Mix colors together"),
+    ("temperature_conversion", Importance.LOW, 0.25, ("basic_arithmetic",),
+     "Convert between temperature units"),
+    ("dice_rolling", Importance.LOW, 0.2, ("generate_random",),
+     "Roll dice"),
+    
+    # TRIVIAL - First to be forgotten
+    ("ascii_art", Importance.TRIVIAL, 0.15, (),
+     "Generate simple ASCII art"),
+    ("fortune_cookie", Importance.TRIVIAL, 0.1, (),
+     "Generate fortune cookie messages"),
+    ("mood_emoji", Importance.TRIVIAL, 0.1, (),
+     "Express mood with emojis"),
+    ("trivia_fact", Importance.TRIVIAL, 0.12, (),
+     "Share random trivia facts"),
+    ("word_scramble", Importance.TRIVIAL, 0.08, ("string_manipulation",),
+     "Scramble words for fun"),
+    ("countdown", Importance.TRIVIAL, 0.05, ("count",),
+     "Count down from a number"),
+)
+
+
+# Results of capabilities whose inputs are fixed, computed once at import.
+# Sequences are stored as tuples; list results are copied on return, so
+# callers that mutate the returned list cannot corrupt later calls.
+_PATTERN_NEXT = [1, 2, 4, 8, 16][-1] * 2
+_LIST_MANAGEMENT_RESULT = tuple(reversed(range(1, 7)))
+_COUNTDOWN = (5, 4, 3, 2, 1, "Liftoff!")
+_STRING_MANIPULATION_RESULT = "hello world".upper().replace("O", "0")
+
+# Populations for batched draws: one rng.choices(population, k=n) call
+# replaces n separate randint calls.
+_RANGE_100 = range(1, 101)
+_RANGE_50 = range(1, 51)
+_DIE_FACES = range(1, 7)
+
+# Static payloads the capabilities pick from, built once at import rather
+# than on every call.
+_JOKES = (
+    "Why do programmers prefer dark mode? Because light attracts bugs!",
+    "There are only 10 types of people: those who understand binary...",
+    "A SQL query walks into a bar, walks up to two tables and asks 'Can I join you?'",
+)
+_RHYMES = (
+    ("cat", "hat"),
+    ("dog", "log"),
+    ("time", "rhyme"),
+    ("day", "way"),
+)
+_RHYME_LINES = tuple(f"The {a} sat on the {b}" for a, b in _RHYMES)
+_MIXTURES = {
+    ("red", "blue"): "purple",
+    ("red", "yellow"): "orange",
+    ("blue", "yellow"): "green",
+    ("red", "white"): "pink",
+}
+_COLOR_MIXES = tuple(f"{a} + {b} = {mixed}" for (a, b), mixed in _MIXTURES.items())
+# Every outcome of two dice, so a roll is a single draw of a finished string
+_DICE_ROLLS = tuple(
+    f"Rolled [{a}, {b}], total: {a + b}" for a in _DIE_FACES for b in _DIE_FACES
+)
+_ARTS = (
+    "¯\\_(ツ)_/¯",
+    "(╯°□°)╯︵ ┻━┻",
+    "( ͡° ͜ʖ ͡°)",
+    "ᕦ(ò_óˇ)ᕤ",
+)
+_FORTUNES = (
+    "A journey of a thousand miles begins with a single step.",
+    "Good things come to those who wait... but better things come to those who work for it.",
+    "The best time to plant a tree was 20 years ago. The second best time is now.",
+    "Your future is whatever you make it, so make it a good one.",
+)
+_MOODS = ("😊", "🤔", "😴", "🎉", "💭", "✨")
+_FACTS = (
+    "Honey never spoils.",
+    "Octopuses have three hearts.",
+    "A group of flamingos is called a 'flamboyance'.",
+    "Venus is the only planet that spins clockwise.",
+)
+_WORDS = ("programming", "computer", "algorithm", "memory")
+# (word, length, " (was: word)") so a scramble only formats the shuffled part
+_SCRAMBLES = tuple((word, len(word), f" (was: {word})") for word in _WORDS)
+
+
+@functools.lru_cache(maxsize=128)
+def _format_temperature(celsius: int) -> str:
+    """Format a Celsius temperature alongside its Fahrenheit conversion.
+
+    Cached because temperature_conversion only draws from 61 values.
 
-    This function registers various cognitive capabilities organized by importance
-    levels (Essential, Critical, High, Medium, Low, Trivial). Each capability
-    demonstrates different aspects of the Lethe system's functionality.
+    Args:
+        celsius: Temperature in degrees Celsius.
+
+    Returns:
+        str: A string such as "25°C = 77.0°F".
+    """
+    fahrenheit = (celsius * 9/5) + 32
+    return f"{celsius}°C = {fahrenheit:.1f}°F"
+
+
+def _build_capabilities(rng: random.Random) -> Dict[str, Callable]:
+    """Build the default capability functions.
+
+    Each function is named after the capability it implements and shares
+    the given random generator, so a seeded registration is reproducible.
 
     Args:
-        lethe: The Lethe instance to register capabilities with.
-        seed: Random seed for reproducible behavior. If None, random behavior
-            will be non-deterministic.
+        rng: Random generator used by the non-deterministic capabilities.
 
     Returns:
-        None
+        Dict mapping capability names to their functions.
     """
-    rng = random.Random(seed)
-    
     # =========================================================================
     # ESSENTIAL CAPABILITIES - Cannot be degraded
     # =========================================================================
     
-    @lethe.register(
-        name="heartbeat",
-        importance=Importance.ESSENTIAL,
-        degradation_resistance=1.0,
-        description="Core heartbeat - proves the system is alive"
-    )
     def heartbeat():
         """Provide a heartbeat signal proving the system is alive.
 
@@ -52,12 +191,6 @@ def register_default_capabilities(lethe: Lethe, seed: Optional[int] = None) -> N
         """
         return "pulse"
     
-    @lethe.register(
-        name="self_awareness",
-        importance=Importance.ESSENTIAL,
-        degradation_resistance=1.0,
-        description="Basic awareness that the system exists"
-    )
     def self_awareness():
         """Demonstrate basic self-awareness of the system.
 
@@ -73,12 +206,13 @@ def register_default_capabilities(lethe: Lethe, seed: Optional[int] = None) -> N
     # CRITICAL CAPABILITIES - Strongly resist degradation
     # =========================================================================
     
-    @lethe.register(
-        name="count",
-        importance=Importance.CRITICAL,
-        degradation_resistance=0.9,
-        description="Ability to count and track numbers"
-    )
+    # Bound once so each call skips the attribute lookup on rng
+    randint = rng.randint
+    choice = rng.choice
+    choices = rng.choices
+    sample = rng.sample
+    counter = itertools.count(1)
+    
     def count():
         """Increment and return a persistent counter.
 
@@ -88,15 +222,8 @@ def register_default_capabilities(lethe: Lethe, seed: Optional[int] = None) -> N
         Returns:
             int: The current count value after incrementing.
         """
-        count.counter = getattr(count, 'counter', 0) + 1
-        return count.counter
-    
-    @lethe.register(
-        name="time_sense",
-        importance=Importance.CRITICAL,
-        degradation_resistance=0.85,
-        description="Awareness of time passage"
-    )
+        return next(counter)
+    
     def time_sense():
         """Return the current Unix timestamp.
 
@@ -108,12 +235,6 @@ def register_default_capabilities(lethe: Lethe, seed: Optional[int] = None) -> N
         """
         return time.time()
     
-    @lethe.register(
-        name="basic_arithmetic",
-        importance=Importance.CRITICAL,
-        degradation_resistance=0.8,
-        description="Basic mathematical operations"
-    )
     def basic_arithmetic():
         """Perform basic addition of two random integers.
 
@@ -122,19 +243,12 @@ def register_default_capabilities(lethe: Lethe, seed: Optional[int] = None) -> N
         Returns:
             int: The sum of two randomly generated integers.
         """
-        a, b = rng.randint(1, 100), rng.randint(1, 100)
-        return a + b
+        return sum(choices(_RANGE_100, k=2))
     
     # =========================================================================
     # HIGH IMPORTANCE CAPABILITIES - Resist degradation
     # =========================================================================
     
-    @lethe.register(
-        name="remember_name",
-        importance=Importance.HIGH,
-        degradation_resistance=0.7,
-        description="Remember the system's own name"
-    )
     def remember_name():
         """Return the system's own name.
 
@@ -146,12 +260,6 @@ def register_default_capabilities(lethe: Lethe, seed: Optional[int] = None) -> N
         """
         return "I am Lethe"
     
-    @lethe.register(
-        name="pattern_recognition",
-        importance=Importance.HIGH,
-        degradation_resistance=0.65,
-        description="Recognize simple patterns"
-    )
     def pattern_recognition():
         """Recognize and extend a geometric pattern.
 
@@ -161,16 +269,8 @@ def register_default_capabilities(lethe: Lethe, seed: Optional[int] = None) -> N
         Returns:
             int: The next value in the geometric sequence (32).
         """
-        sequence = [1, 2, 4, 8, 16]
-        next_val = sequence[-1] * 2
-        return next_val
-    
-    @lethe.register(
-        name="compare",
-        importance=Importance.HIGH,
-        degradation_resistance=0.6,
-        description="Compare two values"
-    )
+        return _PATTERN_NEXT
+    
     def compare():
         """Compare two randomly generated integers.
 
@@ -181,19 +281,13 @@ def register_default_capabilities(lethe: Lethe, seed: Optional[int] = None) -> N
             str: A description of the comparison result - "first is greater",
                 "second is greater", or "equal".
         """
-        a, b = rng.randint(1, 100), rng.randint(1, 100)
+        a, b = choices(_RANGE_100, k=2)
         if a > b:
             return "first is greater"
         elif b > a:
             return "second is greater"
         return "equal"
     
-    @lethe.register(
-        name="list_management",
-        importance=Importance.HIGH,
-        degradation_resistance=0.55,
-        description="Manage and manipulate lists"
-    )
     def list_management():
         """Demonstrate list creation and manipulation operations.
 
@@ -203,35 +297,20 @@ def register_default_capabilities(lethe: Lethe, seed: Optional[int] = None) -> N
         Returns:
             list[int]: A reversed list of integers [6, 5, 4, 3, 2, 1].
         """
-        items = list(range(1, 6))
-        items.append(6)
-        items.reverse()
-        return items
+        return list(_LIST_MANAGEMENT_RESULT)
     
     # =========================================================================
     # MEDIUM IMPORTANCE CAPABILITIES - Standard degradation resistance
     # =========================================================================
     
-    @lethe.register(
-        name="generate_random",
-        importance=Importance.MEDIUM,
-        degradation_resistance=0.5,
-        description="Generate random numbers"
-    )
     def generate_random():
         """Generate a random integer between 1 and 1000.
 
         Returns:
             int: A randomly generated integer in the range [1, 1000].
         """
-        return rng.randint(1, 1000)
-    
-    @lethe.register(
-        name="string_manipulation",
-        importance=Importance.MEDIUM,
-        degradation_resistance=0.45,
-        description="Manipulate text strings"
-    )
+        return randint(1, 1000)
+    
     def string_manipulation():
         """Perform string transformation operations.
 
@@ -240,16 +319,8 @@ def register_default_capabilities(lethe: Lethe, seed: Optional[int] = None) -> N
         Returns:
             str: The transformed string "HELL0 W0RLD".
         """
-        text = "hello world"
-        return text.upper().replace("O", "0")
-    
-    @lethe.register(
-        name="calculate_average",
-        importance=Importance.MEDIUM,
-        dependencies=["basic_arithmetic"],
-        degradation_resistance=0.4,
-        description="Calculate averages of number sets"
-    )
+        return _STRING_MANIPULATION_RESULT
+    
     def calculate_average():
         """Calculate the arithmetic mean of random numbers.
 
@@ -259,16 +330,8 @@ def register_default_capabilities(lethe: Lethe, seed: Optional[int] = None) -> N
         Returns:
             float: The arithmetic mean of the generated numbers.
         """
-        numbers = [rng.randint(1, 100) for _ in range(5)]
-        return sum(numbers) / len(numbers)
-    
-    @lethe.register(
-        name="sort_numbers",
-        importance=Importance.MEDIUM,
-        dependencies=["compare"],
-        degradation_resistance=0.45,
-        description="Sort lists of numbers"
-    )
+        return sum(choices(_RANGE_100, k=5)) / 5
+    
     def sort_numbers():
         """Sort a list of random integers in ascending order.
 
@@ -278,16 +341,8 @@ def register_default_capabilities(lethe: Lethe, seed: Optional[int] = None) -> N
         Returns:
             list[int]: A sorted list of 10 random integers.
         """
-        numbers = [rng.randint(1, 100) for _ in range(10)]
-        return sorted(numbers)
-    
-    @lethe.register(
-        name="find_maximum",
-        importance=Importance.MEDIUM,
-        dependencies=["compare"],
-        degradation_resistance=0.4,
-        description="Find the maximum value"
-    )
+        return sorted(choices(_RANGE_100, k=10))
+    
     def find_maximum():
         """Find the maximum value in a list of random integers.
 
@@ -297,16 +352,8 @@ def register_default_capabilities(lethe: Lethe, seed: Optional[int] = None) -> N
         Returns:
             int: The maximum value from the generated list.
         """
-        numbers = [rng.randint(1, 100) for _ in range(10)]
-        return max(numbers)
-    
-    @lethe.register(
-        name="calculate_sum",
-        importance=Importance.MEDIUM,
-        dependencies=["basic_arithmetic"],
-        degradation_resistance=0.4,
-        description="Sum a list of numbers"
-    )
+        return max(choices(_RANGE_100, k=10))
+    
     def calculate_sum():
         """Calculate the sum of random integers.
 
@@ -316,19 +363,12 @@ def register_default_capabilities(lethe: Lethe, seed: Optional[int] = None) -> N
         Returns:
             int: The sum of the generated integers.
         """
-        numbers = [rng.randint(1, 50) for _ in range(8)]
-        return sum(numbers)
+        return sum(choices(_RANGE_50, k=8))
     
     # =========================================================================
     # LOW IMPORTANCE CAPABILITIES - Less resistant to degradation
     # =========================================================================
     
-    @lethe.register(
-        name="joke_telling",
-        importance=Importance.LOW,
-        degradation_resistance=0.3,
-        description="Tell simple jokes"
-    )
     def joke_telling():
         """Tell a random programming-related joke.
 
@@ -338,19 +378,8 @@ def register_default_capabilities(lethe: Lethe, seed: Optional[int] = None) -> N
         Returns:
             str: A randomly selected programming joke.
         """
-        jokes = [
-            "Why do programmers prefer dark mode? Because light attracts bugs!",
-            "There are only 10 types of people: those who understand binary...",
-            "A SQL query walks into a bar, walks up to two tables and asks 'Can I join you?'",
-        ]
-        return rng.choice(jokes)
-    
-    @lethe.register(
-        name="rhyme_generation",
-        importance=Importance.LOW,
-        degradation_resistance=0.25,
-        description="Generate simple rhymes"
-    )
+        return choice(_JOKES)
+    
     def rhyme_generation():
         """Generate a simple rhyming sentence.
 
@@ -360,21 +389,8 @@ def register_default_capabilities(lethe: Lethe, seed: Optional[int] = None) -> N
         Returns:
             str: A sentence containing a rhyming word pair.
         """
-        rhymes = [
-            ("cat", "hat"),
-            ("dog", "log"),
-            ("time", "rhyme"),
-            ("day", "way"),
-        ]
-        pair = rng.choice(rhymes)
-        return f"The {pair[0]} sat on the {pair[1]}"
-    
-    @lethe.register(
-        name="color_mixing",
-        importance=Importance.LOW,
-        degradation_resistance=0.3,
-        description="Mix colors together"
-    )
+        return choice(_RHYME_LINES)
+    
     def color_mixing():
         """Demonstrate color mixing by combining two primary colors.
 
@@ -385,22 +401,8 @@ def register_default_capabilities(lethe: Lethe, seed: Optional[int] = None) -> N
             str: A string describing the color combination and result,
                 e.g., "red + blue = purple".
         """
-        mixtures = {
-            ("red", "blue"): "purple",
-            ("red", "yellow"): "orange",
-            ("blue", "yellow"): "green",
-            ("red", "white"): "pink",
-        }
-        pair = rng.choice(list(mixtures.keys()))
-        return f"{pair[0]} + {pair[1]} = {mixtures[pair]}"
-    
-    @lethe.register(
-        name="temperature_conversion",
-        importance=Importance.LOW,
-        dependencies=["basic_arithmetic"],
-        degradation_resistance=0.25,
-        description="Convert between temperature units"
-    )
+        return choice(_COLOR_MIXES)
+    
     def temperature_conversion():
         """Convert a random Celsius temperature to Fahrenheit.
 
@@ -411,17 +413,8 @@ def register_default_capabilities(lethe: Lethe, seed: Optional[int] = None) -> N
             str: A formatted string showing both Celsius and Fahrenheit values,
                 e.g., "25°C = 77.0°F".
         """
-        celsius = rng.randint(-20, 40)
-        fahrenheit = (celsius * 9/5) + 32
-        return f"{celsius}°C = {fahrenheit:.1f}°F"
-    
-    @lethe.register(
-        name="dice_rolling",
-        importance=Importance.LOW,
-        dependencies=["generate_random"],
-        degradation_resistance=0.2,
-        description="Roll dice"
-    )
+        return _format_temperature(randint(-20, 40))
+    
     def dice_rolling():
         """Simulate rolling two six-sided dice.
 
@@ -432,19 +425,12 @@ def register_default_capabilities(lethe: Lethe, seed: Optional[int] = None) -> N
             str: A formatted string showing the individual dice values
                 and their sum, e.g., "Rolled [3, 5], total: 8".
         """
-        dice = [rng.randint(1, 6) for _ in range(2)]
-        return f"Rolled {dice}, total: {sum(dice)}"
+        return choice(_DICE_ROLLS)
     
     # =========================================================================
     # TRIVIAL CAPABILITIES - First to be forgotten
     # =========================================================================
     
-    @lethe.register(
-        name="ascii_art",
-        importance=Importance.TRIVIAL,
-        degradation_resistance=0.15,
-        description="Generate simple ASCII art"
-    )
     def ascii_art():
         """Generate a random ASCII art emoticon.
 
@@ -454,20 +440,8 @@ def register_default_capabilities(lethe: Lethe, seed: Optional[int] = None) -> N
         Returns:
             str: A randomly selected ASCII art emoticon.
         """
-        arts = [
-            "¯\\_(ツ)_/¯",
-            "(╯°□°)╯︵ ┻━┻",
-            "( ͡° ͜ʖ ͡°)",
-            "ᕦ(ò_óˇ)ᕤ",
-        ]
-        return rng.choice(arts)
-    
-    @lethe.register(
-        name="fortune_cookie",
-        importance=Importance.TRIVIAL,
-        degradation_resistance=0.1,
-        description="Generate fortune cookie messages"
-    )
+        return choice(_ARTS)
+    
     def fortune_cookie():
         """Generate a random fortune cookie message.
 
@@ -477,20 +451,8 @@ def register_default_capabilities(lethe: Lethe, seed: Optional[int] = None) -> N
         Returns:
             str: A randomly selected inspirational fortune message.
         """
-        fortunes = [
-            "A journey of a thousand miles begins with a single step.",
-            "Good things come to those who wait... but better things come to those who work for it.",
-            "The best time to plant a tree was 20 years ago. The second best time is now.",
-            "Your future is whatever you make it, so make it a good one.",
-        ]
-        return rng.choice(fortunes)
-    
-    @lethe.register(
-        name="mood_emoji",
-        importance=Importance.TRIVIAL,
-        degradation_resistance=0.1,
-        description="Express mood with emojis"
-    )
+        return choice(_FORTUNES)
+    
     def mood_emoji():
         """Express a random mood using an emoji.
 
@@ -500,15 +462,8 @@ def register_default_capabilities(lethe: Lethe, seed: Optional[int] = None) -> N
         Returns:
             str: A randomly selected mood emoji.
         """
-        moods = ["😊", "🤔", "😴", "🎉", "💭", "✨"]
-        return rng.choice(moods)
-    
-    @lethe.register(
-        name="trivia_fact",
-        importance=Importance.TRIVIAL,
-        degradation_resistance=0.12,
-        description="Share random trivia facts"
-    )
+        return choice(_MOODS)
+    
     def trivia_fact():
         """Share a random trivia fact.
 
@@ -518,21 +473,8 @@ def register_default_capabilities(lethe: Lethe, seed: Optional[int] = None) -> N
         Returns:
             str: A randomly selected trivia fact.
         """
-        facts = [
-            "Honey never spoils.",
-            "Octopuses have three hearts.",
-            "A group of flamingos is called a 'flamboyance'.",
-            "Venus is the only planet that spins clockwise.",
-        ]
-        return rng.choice(facts)
-    
-    @lethe.register(
-        name="word_scramble",
-        importance=Importance.TRIVIAL,
-        dependencies=["string_manipulation"],
-        degradation_resistance=0.08,
-        description="Scramble words for fun"
-    )
+        return choice(_FACTS)
+    
     def word_scramble():
         """Scramble the letters of a random word.
 
@@ -543,26 +485,69 @@ def register_default_capabilities(lethe: Lethe, seed: Optional[int] = None) -> N
             str: A formatted string showing the scrambled word and
                 the original, e.g., "groimmnprag (was: programming)".
         """
-        words = ["programming", "computer", "algorithm", "memory"]
-        word = rng.choice(words)
-        chars = list(word)
-        rng.shuffle(chars)
-        return f"{''.join(chars)} (was: {word})"
-    
-    @lethe.register(
-        name="countdown",
-        importance=Importance.TRIVIAL,
-        dependencies=["count"],
-        degradation_resistance=0.05,
-        description="Count down from a number"
-    )
+        word, length, suffix = choice(_SCRAMBLES)
+        return "".join(sample(word, length)) + suffix
+    
     def countdown():
         """Generate a countdown sequence from 5 to liftoff.
 
-        Creates a countdown list starting at 5 and ending with
+        Returns a shared countdown tuple starting at 5 and ending with
         a "Liftoff!" message.
 
         Returns:
-            list: A countdown sequence [5, 4, 3, 2, 1, "Liftoff!"].
+            tuple: A countdown sequence (5, 4, 3, 2, 1, "Liftoff!").
         """
-        return [5, 4, 3, 2, 1, "Liftoff!"]
+        return _COUNTDOWN
+    
+    return {func.__name__: func for func in (
+        heartbeat,
+        self_awareness,
+        count,
+        time_sense,
+        basic_arithmetic,
+        remember_name,
+        pattern_recognition,
+        compare,
+        list_management,
+        generate_random,
+        string_manipulation,
+        calculate_average,
+        sort_numbers,
+        find_maximum,
+        calculate_sum,
+        joke_telling,
+        rhyme_generation,
+        color_mixing,
+        temperature_conversion,
+        dice_rolling,
+        ascii_art,
+        fortune_cookie,
+        mood_emoji,
+        trivia_fact,
+        word_scramble,
+        countdown,
+    )}
+
+
+def register_default_capabilities(lethe: Lethe, seed: Optional[int] = None) -> None:
+    """Register a comprehensive set of default capabilities with the Lethe system.
+
+    This function registers various cognitive capabilities organized by importance
+    levels (Essential, Critical, High, Medium, Low, Trivial). Each capability
+    demonstrates different aspects of the Lethe system's functionality. The
+    capabilities are registered from the ``_DEFAULT_CAPABILITIES`` table in a
+    single loop rather than through one decorator call per capability.
+
+    Args:
+        lethe: The Lethe instance to register capabilities with.
+        seed: Random seed for reproducible behavior. If None, random behavior
+            will be non-deterministic.
+
+    Returns:
+        None
+    """
+    functions = _build_capabilities(random.Random(seed))
+    register = lethe.register_function
+    
+    for name, importance, resistance, dependencies, description in _DEFAULT_CAPABILITIES:
+        register(functions[name], name, importance, dependencies, resistance, description)
@@ -6,11 +6,13 @@ functions with their metadata including importance, dependencies, and
 degradation resistance scores.
 """
 
-from dataclasses import dataclass, field
-from typing import Callable, Dict, List, Optional, Any
+from array import array
+from dataclasses import dataclass
+from typing import Callable, Dict, FrozenSet, Iterable, Iterator, List, Optional, Any, Sequence, Tuple
 from enum import IntEnum
 import functools
 import logging
+import threading
 
 
 class Importance(IntEnum):
@@ -26,7 +28,7 @@ class Importance(IntEnum):
     ESSENTIAL = 6    # Cannot be removed - safety layer protected
 
 
-@dataclass
+@dataclass(slots=True)
 class CapabilityMetadata:
     """
     Metadata associated with a registered capability.
@@ -34,7 +36,7 @@ class CapabilityMetadata:
     Attributes:
         name: Unique identifier for the capability
         importance: How critical this capability is (affects decay order)
-        dependencies: List of capability names this function depends on
+        dependencies: Tuple of capability names this function depends on
         degradation_resistance: Float 0.0-1.0, higher means harder to degrade
         description: Human-readable description of what this capability does
         original_function: Reference to the original unmodified function
@@ -44,7 +46,7 @@ class CapabilityMetadata:
     """
     name: str
     importance: Importance = Importance.MEDIUM
-    dependencies: List[str] = field(default_factory=list)
+    dependencies: Tuple[str, ...] = ()
     degradation_resistance: float = 0.5
     description: str = ""
     original_function: Optional[Callable] = None
@@ -66,8 +68,39 @@ class CapabilityRegistry:
         self._capabilities: Dict[str, Callable] = {}
         self._metadata: Dict[str, CapabilityMetadata] = {}
         self._logger = logging.getLogger("lethe.registry")
-        self._degraded_capabilities: List[str] = []
-        self._deleted_capabilities: List[str] = []
+        # Insertion-ordered dicts used as ordered sets, for O(1) membership
+        self._degraded_capabilities: Dict[str, None] = {}
+        self._deleted_capabilities: Dict[str, None] = {}
+        # Reverse dependency index: capability name -> names that depend on it
+        self._dependents: Dict[str, List[str]] = {}
+        
+        # Guards only the set of capabilities and the degraded/deleted
+        # bookkeeping; per-capability values are read without it
+        self._lock = threading.Lock()
+        
+        # Struct-of-arrays copy of the fields decay selection reads, indexed
+        # by registration order, so a sweep over every capability walks
+        # compact typed arrays instead of metadata objects
+        self._names: List[str] = []
+        self._index: Dict[str, int] = {}
+        self._importances = array('B')
+        self._resistances = array('d')
+        self._levels = array('B')
+        # Bit i is set while the capability at index i is registered and
+        # not degraded, so the active count is a single popcount
+        self._active_mask = 0
+        # Decay rows in priority order, rebuilt lazily after any change
+        self._decay_rows: Optional[Tuple[Tuple[str, int, float, int], ...]] = None
+        # Names of active capabilities, rebuilt lazily after any change
+        self._active_names: Optional[List[str]] = None
+        self._active_set: Optional[FrozenSet[str]] = None
+        # Registered ESSENTIAL capabilities that have not been deleted,
+        # replaced wholesale on the rare change so readers share it
+        self._essential_names: FrozenSet[str] = frozenset()
+        # Bumped on every registration, replacement or degradation, so
+        # readers can tell whether values derived from the registry are
+        # still current
+        self._mutations = 0
     
     def register(
         self,
@@ -91,25 +124,17 @@ class CapabilityRegistry:
             Decorator function that registers the capability
         """
         def decorator(func: Callable) -> Callable:
-            @functools.wraps(func)
-            def wrapper(*args, **kwargs):
-                if name in self._metadata:
-                    self._metadata[name].execution_count += 1
-                return func(*args, **kwargs)
-            
-            self._capabilities[name] = wrapper
-            self._metadata[name] = CapabilityMetadata(
+            wrapper = self.register_function(
+                func,
                 name=name,
                 importance=importance,
-                dependencies=dependencies or [],
-                degradation_resistance=max(0.0, min(1.0, degradation_resistance)),
-                description=description,
-                original_function=func,
-                is_degraded=False,
-                degradation_level=0
+                dependencies=dependencies,
+                degradation_resistance=degradation_resistance,
+                description=description
             )
-            self._logger.debug(f"Registered capability: {name} (importance={importance.name})")
-            return wrapper
+            # The decorated name is rebound to the wrapper, so give it the
+            # function's metadata; plain register_function() callers skip this
+            return functools.update_wrapper(wrapper, func)
         return decorator
     
     def register_function(
@@ -120,7 +145,7 @@ class CapabilityRegistry:
         dependencies: Optional[List[str]] = None,
         degradation_resistance: float = 0.5,
         description: str = ""
-    ) -> None:
+    ) -> Callable:
         """
         Directly register a function as a capability without using decorator syntax.
         
@@ -131,37 +156,92 @@ class CapabilityRegistry:
             dependencies: Other capabilities this one depends on
             degradation_resistance: How much this capability resists decay (0.0-1.0)
             description: Human-readable description
+            
+        Returns:
+            The counting wrapper that get() and execute() dispatch to
         """
-        @functools.wraps(func)
-        def wrapper(*args, **kwargs):
-            if name in self._metadata:
-                self._metadata[name].execution_count += 1
-            return func(*args, **kwargs)
-        
-        self._capabilities[name] = wrapper
-        self._metadata[name] = CapabilityMetadata(
+        resistance = max(0.0, min(1.0, degradation_resistance))
+        metadata = CapabilityMetadata(
             name=name,
             importance=importance,
-            dependencies=dependencies or [],
-            degradation_resistance=max(0.0, min(1.0, degradation_resistance)),
+            dependencies=tuple(dependencies) if dependencies else (),
+            degradation_resistance=resistance,
             description=description,
             original_function=func,
             is_degraded=False,
             degradation_level=0
         )
+        
+        # Callers reach the wrapper through get()/execute(), so it copies
+        # only the name for log messages instead of functools.wraps. It
+        # counts on its own metadata record rather than looking it up by name
+        def wrapper(*args, **kwargs):
+            metadata.execution_count += 1
+            return func(*args, **kwargs)
+        wrapper.__name__ = name
+        
+        with self._lock:
+            previous = self._metadata.get(name)
+            if previous is not None:
+                for dependency in previous.dependencies:
+                    self._dependents[dependency].remove(name)
+            for dependency in metadata.dependencies:
+                self._dependents.setdefault(dependency, []).append(name)
+            
+            # _capabilities only holds callable capabilities, so a deleted
+            # name stays unreachable even when registered again, and its
+            # new record keeps reporting it as deleted
+            if name in self._deleted_capabilities:
+                metadata.is_degraded = True
+                metadata.degradation_level = 3
+            else:
+                self._capabilities[name] = wrapper
+            self._metadata[name] = metadata
+            
+            index = self._index.get(name)
+            if index is None:
+                index = self._index[name] = len(self._names)
+                self._names.append(name)
+                self._importances.append(importance)
+                self._resistances.append(resistance)
+                self._levels.append(0)
+                self._active_mask |= 1 << index
+            else:
+                # A deleted name stays deleted: get() and execute() keep
+                # refusing it, so it must not become a decay candidate again
+                self._importances[index] = importance
+                self._resistances[index] = resistance
+                if name in self._deleted_capabilities:
+                    self._levels[index] = 3
+                else:
+                    self._levels[index] = 0
+                    self._active_mask |= 1 << index
+            if importance == Importance.ESSENTIAL and name not in self._deleted_capabilities:
+                self._essential_names = self._essential_names | {name}
+            elif name in self._essential_names:
+                self._essential_names = self._essential_names - {name}
+            self._decay_rows = None
+            self._active_names = None
+            self._active_set = None
+            self._mutations += 1
+        
         self._logger.debug(f"Registered capability: {name} (importance={importance.name})")
+        return wrapper
     
     def get(self, name: str) -> Optional[Callable]:
         """Gets a capability by name.
 
+        The result is the capability's current implementation. Decay
+        replaces implementations in place, so callers that hold on to it
+        across decay ticks keep calling the undegraded version; look it up
+        again, or use execute(), after any decay.
+
         Args:
             name: The unique identifier of the capability to retrieve.
 
         Returns:
             The capability function if found and not deleted, None otherwise.
         """
-        if name in self._deleted_capabilities:
-            return None
         return self._capabilities.get(name)
     
     def get_metadata(self, name: str) -> Optional[CapabilityMetadata]:
@@ -190,14 +270,14 @@ class CapabilityRegistry:
         Raises:
             KeyError: If the capability doesn't exist
         """
-        if name in self._deleted_capabilities:
-            self._logger.warning(f"Attempted to execute deleted capability: {name}")
-            return None
-        
-        if name not in self._capabilities:
+        func = self._capabilities.get(name)
+        if func is None:
+            if name in self._deleted_capabilities:
+                self._logger.warning(f"Attempted to execute deleted capability: {name}")
+                return None
             raise KeyError(f"Unknown capability: {name}")
         
-        return self._capabilities[name](*args, **kwargs)
+        return func(*args, **kwargs)
     
     def list_capabilities(self) -> List[str]:
         """Gets list of all registered capability names.
@@ -207,8 +287,7 @@ class CapabilityRegistry:
         Returns:
             List of capability name strings.
         """
-        return [name for name in self._capabilities.keys() 
-                if name not in self._deleted_capabilities]
+        return list(self._capabilities)
     
     def list_active_capabilities(self) -> List[str]:
         """Gets list of capabilities that haven't been degraded.
@@ -216,8 +295,85 @@ class CapabilityRegistry:
         Returns:
             List of capability name strings that are still fully functional.
         """
-        return [name for name, meta in self._metadata.items()
-                if not meta.is_degraded and name not in self._deleted_capabilities]
+        active = self._active_names
+        if active is None:
+            active = [name for name, meta in self.snapshot()
+                      if not meta.is_degraded and name not in self._deleted_capabilities]
+            self._active_names = active
+        return active.copy()
+    
+    def active_names(self) -> FrozenSet[str]:
+        """Gets the names of capabilities that haven't been degraded as a set.
+
+        The set is shared between calls until the registry changes, so
+        membership tests and intersections need no copy.
+
+        Returns:
+            Frozen set of the fully functional capability names.
+        """
+        active = self._active_set
+        if active is None:
+            active = frozenset(self.list_active_capabilities())
+            self._active_set = active
+        return active
+    
+    def essential_names(self) -> FrozenSet[str]:
+        """Gets the names of essential capabilities that haven't been deleted.
+
+        Returns:
+            Frozen set of ESSENTIAL capability names, shared between calls.
+        """
+        return self._essential_names
+    
+    def snapshot(self) -> List[Tuple[str, CapabilityMetadata]]:
+        """Gets a point-in-time list of every capability and its metadata.
+
+        Only copying the mapping takes the registry lock, so callers can
+        format or aggregate the result while registration and decay carry on.
+
+        Returns:
+            List of (name, metadata) tuples in registration order.
+        """
+        with self._lock:
+            return list(self._metadata.items())
+    
+    def level_columns(
+        self,
+        count: Optional[int] = None,
+        indices: Optional[Sequence[int]] = None
+    ) -> Tuple[array, array]:
+        """Gets point-in-time copies of the importance and level columns.
+
+        Both arrays are indexed by registration order, so the first n
+        entries describe the first n capabilities ever registered.
+
+        Args:
+            count: Copy only the first count entries. Defaults to all of them.
+            indices: Copy only the entries at these registration indices,
+                in the given order. Takes precedence over count.
+
+        Returns:
+            Tuple of (importances, degradation levels) as typed arrays.
+        """
+        with self._lock:
+            if indices is None:
+                return self._importances[:count], self._levels[:count]
+            return (
+                array('B', map(self._importances.__getitem__, indices)),
+                array('B', map(self._levels.__getitem__, indices)),
+            )
+    
+    def registration_indices(self, names: Iterable[str]) -> List[int]:
+        """Gets the column index of each registered name, in ascending order.
+
+        Args:
+            names: Capability names; unregistered names are skipped.
+
+        Returns:
+            Sorted registration indices, usable with level_columns().
+        """
+        index = self._index
+        return sorted(index[name] for name in names if name in index)
     
     def list_degraded_capabilities(self) -> List[str]:
         """Gets list of capabilities that have been degraded.
@@ -225,7 +381,7 @@ class CapabilityRegistry:
         Returns:
             List of capability name strings that have been degraded.
         """
-        return self._degraded_capabilities.copy()
+        return list(self._degraded_capabilities)
     
     def list_deleted_capabilities(self) -> List[str]:
         """Gets list of capabilities that have been completely deleted.
@@ -233,7 +389,18 @@ class CapabilityRegistry:
         Returns:
             List of capability name strings that have been deleted.
         """
-        return self._deleted_capabilities.copy()
+        return list(self._deleted_capabilities)
+    
+    def is_deleted(self, name: str) -> bool:
+        """Checks whether a capability has been completely deleted.
+
+        Args:
+            name: The capability name to check.
+
+        Returns:
+            True if the capability has been deleted.
+        """
+        return name in self._deleted_capabilities
     
     def mark_degraded(self, name: str, level: int = 1) -> None:
         """
@@ -243,11 +410,23 @@ class CapabilityRegistry:
             name: The capability name
             level: Degradation level (1=approximated, 2=stubbed, 3=deleted)
         """
-        if name in self._metadata:
-            self._metadata[name].is_degraded = True
-            self._metadata[name].degradation_level = level
-            if name not in self._degraded_capabilities:
-                self._degraded_capabilities.append(name)
+        with self._lock:
+            meta = self._metadata.get(name)
+            if meta is None:
+                return
+            # The record, the level column and the derived caches change
+            # together, so snapshot() and the column readers never see
+            # one without the others
+            meta.is_degraded = True
+            meta.degradation_level = level
+            index = self._index[name]
+            self._levels[index] = level
+            self._decay_rows = None
+            self._active_names = None
+            self._active_set = None
+            self._mutations += 1
+            self._active_mask &= ~(1 << index)
+            self._degraded_capabilities[name] = None
     
     def mark_deleted(self, name: str) -> None:
         """Marks a capability as completely deleted.
@@ -255,8 +434,11 @@ class CapabilityRegistry:
         Args:
             name: The capability name to mark as deleted.
         """
-        if name not in self._deleted_capabilities:
-            self._deleted_capabilities.append(name)
+        with self._lock:
+            self._deleted_capabilities[name] = None
+            self._capabilities.pop(name, None)
+            if name in self._essential_names:
+                self._essential_names = self._essential_names - {name}
         self.mark_degraded(name, level=3)
     
     def replace_capability(self, name: str, new_func: Callable) -> None:
@@ -269,6 +451,7 @@ class CapabilityRegistry:
         """
         if name in self._capabilities:
             self._capabilities[name] = new_func
+            self._mutations += 1
             self._logger.debug(f"Replaced capability implementation: {name}")
     
     def get_degradation_candidates(self) -> List[str]:
@@ -281,16 +464,39 @@ class CapabilityRegistry:
         Returns:
             List of capability names ordered by degradation priority.
         """
-        candidates = []
-        for name, meta in self._metadata.items():
-            if (meta.importance != Importance.ESSENTIAL and 
-                name not in self._deleted_capabilities and
-                meta.degradation_level < 3):
-                candidates.append((name, meta))
-        
-        # Sort by importance (ascending), then by degradation resistance (ascending)
-        candidates.sort(key=lambda x: (x[1].importance, x[1].degradation_resistance))
-        return [name for name, _ in candidates]
+        return [row[0] for row in self.decay_rows()]
+    
+    def iter_decay_columns(self) -> Iterator[Tuple[str, int, float, int]]:
+        """Iterates the decay-relevant fields of every decayable capability.
+
+        Walks the registry's struct-of-arrays columns in registration order,
+        skipping essential capabilities and those already deleted.
+
+        Yields:
+            Tuples of (name, importance, degradation_resistance, degradation_level).
+        """
+        # The importance column holds plain ints; compare against one too
+        essential = int(Importance.ESSENTIAL)
+        for row in zip(self._names, self._importances, self._resistances, self._levels):
+            if row[1] != essential and row[3] < 3:
+                yield row
+    
+    def decay_rows(self) -> Tuple[Tuple[str, int, float, int], ...]:
+        """Gets the decay columns of every candidate in degradation priority order.
+
+        The sorted rows are cached until the next registration or
+        degradation, so repeated decay ticks do not re-sort the registry.
+
+        Returns:
+            Tuple of (name, importance, degradation_resistance, degradation_level)
+            rows sorted by importance, then degradation resistance.
+        """
+        rows = self._decay_rows
+        if rows is None:
+            # Sort by importance (ascending), then by degradation resistance (ascending)
+            rows = tuple(sorted(self.iter_decay_columns(), key=lambda row: (row[1], row[2])))
+            self._decay_rows = rows
+        return rows
     
     def capability_count(self) -> int:
         """Gets the total number of registered capabilities.
@@ -298,7 +504,16 @@ class CapabilityRegistry:
         Returns:
             The count of all registered capabilities.
         """
-        return len(self._capabilities)
+        return len(self._metadata)
+    
+    def mutation_count(self) -> int:
+        """Gets the number of changes made to the registry so far.
+
+        Returns:
+            A counter that increases whenever a capability is registered,
+            replaced or degraded.
+        """
+        return self._mutations
     
     def active_count(self) -> int:
         """Gets the number of non-degraded capabilities.
@@ -306,7 +521,7 @@ class CapabilityRegistry:
         Returns:
             The count of capabilities that are still fully functional.
         """
-        return len(self.list_active_capabilities())
+        return self._active_mask.bit_count()
     
     def degraded_count(self) -> int:
         """Gets the number of degraded capabilities.
@@ -322,7 +537,7 @@ class CapabilityRegistry:
         Returns:
             Dict mapping capability names to lists of their dependencies.
         """
-        return {name: meta.dependencies for name, meta in self._metadata.items()}
+        return {name: list(meta.dependencies) for name, meta in self._metadata.items()}
     
     def get_dependents(self, name: str) -> List[str]:
         """Gets list of capabilities that depend on the given capability.
@@ -333,11 +548,7 @@ class CapabilityRegistry:
         Returns:
             List of capability names that depend on the given capability.
         """
-        dependents = []
-        for cap_name, meta in self._metadata.items():
-            if name in meta.dependencies:
-                dependents.append(cap_name)
-        return dependents
+        return list(self._dependents.get(name, ()))
 
 
 # Global registry instance
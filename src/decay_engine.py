@@ -6,16 +6,44 @@ system capabilities over time. It manages the schedule and execution of
 capability degradation while maintaining internal consistency.
 """
 
+import bisect
+import itertools
 import random
 import time
-from typing import Callable, Optional, List, Dict, Any
+from array import array
+from collections import deque
+from typing import Callable, Deque, Iterable, Iterator, Optional, List, Dict, Any
 from dataclasses import dataclass
 import logging
 
 from .capability import CapabilityRegistry, Importance
 
 
-@dataclass
+def _selection_weight(importance: int, resistance: float, level: int) -> float:
+    """Weight of a capability in decay target selection.
+
+    Lower importance and lower resistance give a higher weight, reduced
+    for already degraded capabilities. The minimum weight avoids division
+    by zero.
+
+    Args:
+        importance: Importance level (1-6)
+        resistance: Degradation resistance (0.0-1.0)
+        level: Current degradation level (0-2)
+
+    Returns:
+        The selection weight, at least 0.01.
+    """
+    return max(0.01, (7 - importance) / 6.0 * (1.0 - resistance) * (3 - level) / 3.0)
+
+
+# Values stubs return for immutable return types, shared between calls
+_STUB_DEFAULTS: Dict[type, Any] = {int: 0, float: 0.0, str: "", bool: False}
+# Mutable defaults are built fresh on every call so callers never share one
+_STUB_FACTORIES: Dict[type, Callable[[], Any]] = {list: list, dict: dict}
+
+
+@dataclass(frozen=True, slots=True)
 class DecayEvent:
     """
     Record of a decay event that occurred in the system.
@@ -57,7 +85,8 @@ class DecayEngine:
         registry: CapabilityRegistry,
         decay_interval: float = 10.0,
         decay_probability: float = 0.3,
-        seed: Optional[int] = None
+        seed: Optional[int] = None,
+        max_history: int = 1000
     ):
         """
         Initialize the decay engine.
@@ -67,18 +96,26 @@ class DecayEngine:
             decay_interval: Seconds between decay attempts
             decay_probability: Base probability of decay per interval (0.0-1.0)
             seed: Random seed for reproducible decay patterns
+            max_history: Number of most recent decay events kept in the history
         """
         self._registry = registry
         self._decay_interval = decay_interval
         self._decay_probability = decay_probability
         self._logger = logging.getLogger("lethe.decay")
-        self._decay_history: List[DecayEvent] = []
-        self._last_decay_time: float = time.time()
+        self._decay_history: Deque[DecayEvent] = deque(maxlen=max_history)
+        # Events per decay type over the engine's lifetime, kept alongside
+        # the bounded history so statistics never scan it
+        self._type_counts: Dict[str, int] = dict.fromkeys(
+            (self.DECAY_APPROXIMATE, self.DECAY_STUB, self.DECAY_DELETE), 0
+        )
+        # Monotonic deadline before which no decay is attempted
+        self._next_decay_time: float = time.monotonic() + decay_interval
         self._total_decays: int = 0
         self._is_enabled: bool = True
-        
-        if seed is not None:
-            random.seed(seed)
+        # Prefix sums of the selection weights for the registry's current
+        # decay rows; recomputed only when the registry hands out new rows
+        self._weighted_rows: Optional[tuple] = None
+        self._cumulative_weights = array('d')
         
         self._rng = random.Random(seed)
     
@@ -98,7 +135,9 @@ class DecayEngine:
         Args:
             value: New decay interval in seconds. Values below 1.0 are clamped to 1.0.
         """
-        self._decay_interval = max(1.0, value)
+        value = max(1.0, value)
+        self._next_decay_time += value - self._decay_interval
+        self._decay_interval = value
     
     @property
     def decay_probability(self) -> float:
@@ -118,6 +157,15 @@ class DecayEngine:
         """
         self._decay_probability = max(0.0, min(1.0, value))
     
+    @property
+    def total_decays(self) -> int:
+        """Get the number of decays applied so far.
+
+        Returns:
+            int: Total decay events since creation or the last reset.
+        """
+        return self._total_decays
+    
     @property
     def is_enabled(self) -> bool:
         """Check if the decay engine is enabled.
@@ -143,18 +191,27 @@ class DecayEngine:
         self._is_enabled = False
         self._logger.info("Decay engine disabled")
     
-    def should_decay(self) -> bool:
+    def should_decay(self, scheduled: bool = False) -> bool:
         """
         Check if decay should occur based on time and probability.
         
+        Args:
+            scheduled: True when an external scheduler already fires this
+                check once per decay interval, so the engine's own
+                interval gate is skipped
+        
         Returns:
             True if decay should be attempted
         """
         if not self._is_enabled:
             return False
         
-        current_time = time.time()
-        if current_time - self._last_decay_time < self._decay_interval:
+        if not scheduled and time.monotonic() < self._next_decay_time:
+            return False
+        
+        # Nothing left to decay: don't spend a random draw on it. The decay
+        # rows are cached by the registry, so this is usually free
+        if not self._registry.decay_rows():
             return False
         
         return self._rng.random() < self._decay_probability
@@ -168,36 +225,25 @@ class DecayEngine:
         Returns:
             Name of capability to degrade, or None if no candidates
         """
-        candidates = self._registry.get_degradation_candidates()
-        if not candidates:
+        # Same priority order as get_degradation_candidates(), but read
+        # straight from the registry's columns instead of metadata objects
+        rows = self._registry.decay_rows()
+        if not rows:
             return None
         
-        # Weight selection toward less important capabilities
-        weights = []
-        for name in candidates:
-            meta = self._registry.get_metadata(name)
-            if meta:
-                # Lower importance and lower resistance = higher weight
-                importance_weight = (7 - meta.importance) / 6.0
-                resistance_weight = 1.0 - meta.degradation_resistance
-                weight = importance_weight * resistance_weight
-                # Reduce weight for already degraded capabilities
-                if meta.is_degraded:
-                    weight *= (3 - meta.degradation_level) / 3.0
-                weights.append(max(0.01, weight))  # Minimum weight to avoid division by zero
-            else:
-                weights.append(0.01)
-        
-        # Weighted random selection
-        total_weight = sum(weights)
-        r = self._rng.random() * total_weight
-        cumulative = 0.0
-        for i, weight in enumerate(weights):
-            cumulative += weight
-            if r <= cumulative:
-                return candidates[i]
-        
-        return candidates[-1] if candidates else None
+        if rows is not self._weighted_rows:
+            weight = _selection_weight
+            self._cumulative_weights = array('d', itertools.accumulate(
+                weight(importance, resistance, level)
+                for _, importance, resistance, level in rows
+            ))
+            self._weighted_rows = rows
+        
+        # Weighted random selection: first row whose prefix sum reaches r
+        cumulative = self._cumulative_weights
+        r = self._rng.random() * cumulative[-1]
+        index = bisect.bisect_left(cumulative, r)
+        return rows[min(index, len(rows) - 1)][0]
     
     def create_approximation(self, original_func: Callable, error_rate: float = 0.1) -> Callable:
         """
@@ -210,30 +256,33 @@ class DecayEngine:
         Returns:
             A wrapper function that may produce approximate results
         """
+        # Bound once here: the wrapper runs on every call of a degraded
+        # capability, while the generator itself never changes
+        rng = self._rng
+        uniform = rng.random
+        
         def approximated(*args, **kwargs):
             result = original_func(*args, **kwargs)
             
             # Occasionally corrupt the result
-            if self._rng.random() < error_rate:
+            if uniform() < error_rate:
                 if isinstance(result, (int, float)):
                     # Add noise to numeric results
-                    noise = self._rng.gauss(0, abs(result) * 0.1 + 1)
+                    noise = rng.gauss(0, abs(result) * 0.1 + 1)
                     return type(result)(result + noise)
                 elif isinstance(result, str):
                     # Corrupt string results
-                    if len(result) > 0:
-                        chars = list(result)
-                        idx = self._rng.randint(0, len(chars) - 1)
-                        chars[idx] = '?'
-                        return ''.join(chars)
-                elif isinstance(result, list):
-                    # Shuffle or drop elements
+                    if result:
+                        idx = rng.randrange(len(result))
+                        return result[:idx] + '?' + result[idx + 1:]
+                elif isinstance(result, (list, tuple)):
+                    # Shuffle or drop elements, keeping tuples as tuples
                     if len(result) > 1:
-                        result = result.copy()
-                        self._rng.shuffle(result)
-                        if self._rng.random() < 0.3:
-                            result.pop()
-                        return result
+                        items = list(result)
+                        rng.shuffle(items)
+                        if uniform() < 0.3:
+                            items.pop()
+                        return tuple(items) if isinstance(result, tuple) else items
             
             return result
         
@@ -252,23 +301,20 @@ class DecayEngine:
         Returns:
             A stub function that logs and returns a default value
         """
-        def stub(*args, **kwargs):
-            self._logger.debug(f"Stub called for: {name}")
-            if return_type is None:
-                return None
-            elif return_type == int:
-                return 0
-            elif return_type == float:
-                return 0.0
-            elif return_type == str:
-                return ""
-            elif return_type == list:
-                return []
-            elif return_type == dict:
-                return {}
-            elif return_type == bool:
-                return False
-            return None
+        logger = self._logger
+        message = f"Stub called for: {name}"
+        factory = _STUB_FACTORIES.get(return_type)
+        
+        if factory is not None:
+            def stub(*args, **kwargs):
+                logger.debug(message)
+                return factory()
+        else:
+            default = _STUB_DEFAULTS.get(return_type)
+            
+            def stub(*args, **kwargs):
+                logger.debug(message)
+                return default
         
         stub.__name__ = f"stub_{name}"
         stub.__doc__ = f"[DELETED] Stub replacement for {name}"
@@ -338,18 +384,25 @@ class DecayEngine:
         )
         self._decay_history.append(event)
         self._total_decays += 1
-        self._last_decay_time = current_time
+        # An approximation without an original function records no type
+        if decay_type in self._type_counts:
+            self._type_counts[decay_type] += 1
+        self._next_decay_time = time.monotonic() + self._decay_interval
         
         return event
     
-    def tick(self) -> Optional[DecayEvent]:
+    def tick(self, scheduled: bool = False) -> Optional[DecayEvent]:
         """
         Perform a decay tick - check if decay should occur and apply it.
         
+        Args:
+            scheduled: True when an external scheduler owns the decay
+                timing; see should_decay()
+        
         Returns:
             DecayEvent if decay occurred, None otherwise
         """
-        if not self.should_decay():
+        if not self.should_decay(scheduled):
             return None
         
         target = self.select_target()
@@ -381,9 +434,19 @@ class DecayEngine:
         """Get the complete decay history.
 
         Returns:
-            List[DecayEvent]: A copy of all decay events that have occurred.
+            List[DecayEvent]: A copy of the retained decay events, oldest first.
+        """
+        return list(self._decay_history)
+    
+    def iter_history(self) -> Iterator[DecayEvent]:
+        """Iterate over the retained decay events without copying them.
+
+        The history must not be modified while the iterator is in use.
+
+        Returns:
+            Iterator[DecayEvent]: The retained decay events, oldest first.
         """
-        return self._decay_history.copy()
+        return iter(self._decay_history)
     
     def get_recent_history(self, count: int = 10) -> List[DecayEvent]:
         """Get the most recent decay events.
@@ -394,7 +457,11 @@ class DecayEngine:
         Returns:
             List[DecayEvent]: The most recent decay events, up to count.
         """
-        return self._decay_history[-count:]
+        history = self._decay_history
+        if 0 < count < len(history):
+            # Walk back from the newest event instead of copying the history
+            return list(itertools.islice(reversed(history), count))[::-1]
+        return list(history)[-count:]
     
     def get_statistics(self) -> Dict[str, Any]:
         """
@@ -403,16 +470,7 @@ class DecayEngine:
         Returns:
             Dictionary with decay statistics
         """
-        type_counts = {
-            self.DECAY_APPROXIMATE: 0,
-            self.DECAY_STUB: 0,
-            self.DECAY_DELETE: 0
-        }
-        
-        for event in self._decay_history:
-            if event.decay_type in type_counts:
-                type_counts[event.decay_type] += 1
-        
+        type_counts = self._type_counts
         return {
             "total_decays": self._total_decays,
             "decay_interval": self._decay_interval,
@@ -424,6 +482,34 @@ class DecayEngine:
             "history_length": len(self._decay_history)
         }
     
+    def restore_history(
+        self,
+        events: Iterable[DecayEvent],
+        total_decays: Optional[int] = None
+    ) -> None:
+        """Replace the decay history with previously recorded events.
+
+        Used when resuming from a saved state, so statistics and history
+        continue from the earlier run rather than from the replayed decays.
+
+        Args:
+            events: Decay events in the order they originally occurred.
+            total_decays: Total number of decays of the earlier run. The
+                saved history may have been capped at max_history, so this
+                can exceed the number of events; defaults to that number.
+        """
+        self._decay_history.clear()
+        self._total_decays = 0
+        for decay_type in self._type_counts:
+            self._type_counts[decay_type] = 0
+        for event in events:
+            self._decay_history.append(event)
+            self._total_decays += 1
+            if event.decay_type in self._type_counts:
+                self._type_counts[event.decay_type] += 1
+        if total_decays is not None:
+            self._total_decays = max(total_decays, self._total_decays)
+    
     def reset(self) -> None:
         """Reset the decay engine state.
 
@@ -432,5 +518,7 @@ class DecayEngine:
         """
         self._decay_history.clear()
         self._total_decays = 0
-        self._last_decay_time = time.time()
+        for decay_type in self._type_counts:
+            self._type_counts[decay_type] = 0
+        self._next_decay_time = time.monotonic() + self._decay_interval
         self._logger.info("Decay engine reset")
@@ -7,16 +7,59 @@ Uses Python's inspect module and sys.modules for deep introspection.
 """
 
 import inspect
+import itertools
+import operator
 import sys
 import time
-from typing import Dict, List, Optional, Set, Tuple, Any
+import tracemalloc
+from collections import deque
+from typing import Deque, Dict, List, Optional, Set, Tuple, Any
 from dataclasses import dataclass, field
 import logging
 
 from .capability import CapabilityRegistry, CapabilityMetadata, Importance
 
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None
 
-@dataclass
+
+# Share of a capability's importance that still counts toward health,
+# indexed by degradation level (approximated, stubbed, deleted)
+_WEIGHT_BY_LEVEL = (1.0, 0.7, 0.3, 0.0)
+
+# Seconds a resource usage reading is reused before asking the OS again
+_MEMORY_SAMPLE_INTERVAL = 1.0
+
+# Module name prefixes that belong to this project
+_MODULE_PREFIXES = ('src', 'lethe')
+
+
+def _weighted_health(importances, levels) -> float:
+    """
+    Score capabilities by importance, discounted by degradation level.
+    
+    Args:
+        importances: Importance value of each capability
+        levels: Degradation level of each capability, in the same order
+        
+    Returns:
+        Health percentage (0-100), or 100 when there is no weight at all
+    """
+    total_weight = sum(importances)
+    if total_weight == 0:
+        return 100.0
+    
+    current_weight = sum(map(
+        operator.mul,
+        importances,
+        map(_WEIGHT_BY_LEVEL.__getitem__, levels)
+    ))
+    return (current_weight / total_weight) * 100.0
+
+
+@dataclass(frozen=True, slots=True)
 class SystemState:
     """
     Snapshot of the system's current state.
@@ -41,7 +84,7 @@ class SystemState:
     memory_usage: int = 0
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CapabilityLoss:
     """
     Record of a lost capability.
@@ -68,21 +111,37 @@ class Introspector:
     of lost functionality, and provides insights into the system's degradation.
     """
     
-    def __init__(self, registry: CapabilityRegistry):
+    def __init__(self, registry: CapabilityRegistry, max_history: int = 1000):
         """
         Initialize the introspector.
         
         Args:
             registry: The capability registry to introspect
+            max_history: Number of most recent state snapshots kept
         """
         self._registry = registry
         self._logger = logging.getLogger("lethe.introspection")
-        self._state_history: List[SystemState] = []
+        self._state_history: Deque[SystemState] = deque(maxlen=max_history)
+        # Health of the latest snapshots as a plain column, which is all
+        # the trend analysis reads
+        self._recent_health: Deque[float] = deque(maxlen=min(5, max_history))
         self._lost_capabilities: List[CapabilityLoss] = []
+        self._lost_names: Set[str] = set()
         self._known_capabilities: Set[str] = set()
         self._last_snapshot_time: float = 0
         self._initial_capability_count: int = 0
+        # Registration indices of the known capabilities, or None when they
+        # are simply the leading columns
+        self._known_columns: Optional[List[int]] = None
         self._startup_time: float = time.time()
+        # Last computed health and the registry mutation count it reflects
+        self._health_cache: float = 100.0
+        self._health_version: Optional[int] = None
+        # Last process memory reading and the monotonic time it was taken
+        self._memory_sample: int = 0
+        self._memory_sample_time: Optional[float] = None
+        # Lethe module names and the sys.modules size they were collected at
+        self._module_cache: Optional[Tuple[int, List[str]]] = None
     
     def initialize(self) -> None:
         """
@@ -92,6 +151,11 @@ class Introspector:
         """
         self._known_capabilities = set(self._registry.list_capabilities())
         self._initial_capability_count = len(self._known_capabilities)
+        # Names deleted before initialization leave gaps in the columns
+        indices = self._registry.registration_indices(self._known_capabilities)
+        contiguous = indices == list(range(len(indices)))
+        self._known_columns = None if contiguous else indices
+        self._health_version = None
         self._capture_state()
         self._logger.info(
             f"Introspection initialized with {self._initial_capability_count} capabilities"
@@ -104,9 +168,9 @@ class Introspector:
         Returns:
             SystemState snapshot
         """
-        active = self._registry.list_active_capabilities()
-        degraded = self._registry.list_degraded_capabilities()
-        deleted = self._registry.list_deleted_capabilities()
+        active = self._registry.active_count()
+        degraded = self._registry.degraded_count()
+        deleted = len(self._registry.list_deleted_capabilities())
         total = self._registry.capability_count()
         
         if total > 0:
@@ -115,63 +179,79 @@ class Introspector:
         else:
             health = 0.0
         
-        # Try to get memory usage
-        memory = 0
-        try:
-            import tracemalloc
-            if tracemalloc.is_tracing():
-                current, peak = tracemalloc.get_traced_memory()
-                memory = current
-        except Exception:
-            pass
+        memory = self._memory_usage()
         
         state = SystemState(
             timestamp=time.time(),
             total_capabilities=total,
-            active_capabilities=len(active),
-            degraded_capabilities=len(degraded),
-            deleted_capabilities=len(deleted),
+            active_capabilities=active,
+            degraded_capabilities=degraded,
+            deleted_capabilities=deleted,
             health_percentage=health,
             loaded_modules=len(sys.modules),
             memory_usage=memory
         )
         
         self._state_history.append(state)
+        self._recent_health.append(health)
         self._last_snapshot_time = state.timestamp
         return state
     
+    def _memory_usage(self) -> int:
+        """
+        Get the process memory usage for a state snapshot.
+        
+        Uses the traced size when tracemalloc is running, since it has to
+        be started on purpose. Otherwise falls back to the peak resident
+        set size, sampled at most once per second.
+        
+        Returns:
+            Memory usage in bytes, or 0 if unavailable
+        """
+        if tracemalloc.is_tracing():
+            current, peak = tracemalloc.get_traced_memory()
+            return current
+        
+        if resource is None:
+            return 0
+        
+        now = time.monotonic()
+        if (self._memory_sample_time is None
+                or now - self._memory_sample_time >= _MEMORY_SAMPLE_INTERVAL):
+            peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+            # Reported in kilobytes, except on macOS where it is bytes
+            self._memory_sample = peak_rss if sys.platform == "darwin" else peak_rss * 1024
+            self._memory_sample_time = now
+        return self._memory_sample
+    
     def _calculate_health(self) -> float:
         """
         Calculate overall system health based on capability states.
         
+        The result is cached until the registry reports a change, so
+        polling the state while nothing decays does not rescan it.
+        
         Returns:
             Health percentage (0-100)
         """
         if self._initial_capability_count == 0:
             return 100.0
         
-        total_weight = 0.0
-        current_weight = 0.0
-        
-        for name in self._known_capabilities:
-            meta = self._registry.get_metadata(name)
-            if meta:
-                weight = float(meta.importance)
-                total_weight += weight
-                
-                # Calculate capability contribution based on degradation level
-                if meta.degradation_level == 0:
-                    current_weight += weight
-                elif meta.degradation_level == 1:
-                    current_weight += weight * 0.7  # Approximated
-                elif meta.degradation_level == 2:
-                    current_weight += weight * 0.3  # Stubbed
-                # Level 3 (deleted) contributes 0
-        
-        if total_weight == 0:
-            return 100.0
+        version = self._registry.mutation_count()
+        if version == self._health_version:
+            return self._health_cache
+        
+        # Capabilities keep their registration index for life, so the ones
+        # known at initialization are usually exactly the leading columns
+        if self._known_columns is None:
+            importances, levels = self._registry.level_columns(self._initial_capability_count)
+        else:
+            importances, levels = self._registry.level_columns(indices=self._known_columns)
+        health = _weighted_health(importances, levels)
         
-        return (current_weight / total_weight) * 100.0
+        self._health_cache = health
+        self._health_version = version
+        return health
     
     def get_current_state(self) -> SystemState:
         """Get the current system state.
@@ -185,9 +265,9 @@ class Introspector:
         """Get the complete state history.
 
         Returns:
-            List[SystemState]: A copy of all recorded state snapshots.
+            List[SystemState]: A copy of the retained state snapshots, oldest first.
         """
-        return self._state_history.copy()
+        return list(self._state_history)
     
     def get_recent_states(self, count: int = 10) -> List[SystemState]:
         """Get the most recent state snapshots.
@@ -198,7 +278,11 @@ class Introspector:
         Returns:
             List[SystemState]: The most recent state snapshots, up to count.
         """
-        return self._state_history[-count:]
+        history = self._state_history
+        if 0 < count < len(history):
+            # Walk back from the newest snapshot instead of copying the history
+            return list(itertools.islice(reversed(history), count))[::-1]
+        return list(history)[-count:]
     
     def update_lost_capabilities(self) -> List[CapabilityLoss]:
         """
@@ -210,10 +294,9 @@ class Introspector:
         new_losses: List[CapabilityLoss] = []
         current_time = time.time()
         
-        deleted = set(self._registry.list_deleted_capabilities())
-        for name in deleted:
+        for name in self._registry.list_deleted_capabilities():
             # Check if we already recorded this loss
-            if not any(loss.name == name for loss in self._lost_capabilities):
+            if name not in self._lost_names:
                 meta = self._registry.get_metadata(name)
                 if meta:
                     loss = CapabilityLoss(
@@ -224,6 +307,7 @@ class Introspector:
                         description=meta.description
                     )
                     self._lost_capabilities.append(loss)
+                    self._lost_names.add(name)
                     new_losses.append(loss)
                     self._logger.info(f"Recorded capability loss: {name}")
         
@@ -260,17 +344,20 @@ class Introspector:
             return None
         
         func = self._registry.get(name)
+        if func is not None and not meta.is_degraded and meta.original_function:
+            # Describe the registered function, not the registry's counting wrapper
+            func = meta.original_function
         
         info = {
             "name": meta.name,
             "importance": meta.importance.name,
-            "dependencies": meta.dependencies,
+            "dependencies": list(meta.dependencies),
             "degradation_resistance": meta.degradation_resistance,
             "description": meta.description,
             "is_degraded": meta.is_degraded,
             "degradation_level": meta.degradation_level,
             "execution_count": meta.execution_count,
-            "is_deleted": name in self._registry.list_deleted_capabilities(),
+            "is_deleted": self._registry.is_deleted(name),
         }
         
         # Add function introspection if available
@@ -293,14 +380,21 @@ class Introspector:
         Returns:
             Dictionary with module information
         """
-        lethe_modules = [
-            name for name in sys.modules.keys()
-            if name.startswith('src') or name.startswith('lethe')
-        ]
+        total = len(sys.modules)
+        cache = self._module_cache
+        if cache is not None and cache[0] == total:
+            # Modules are rarely unloaded, so an unchanged count means no imports
+            lethe_modules = cache[1]
+        else:
+            lethe_modules = [
+                name for name in list(sys.modules)
+                if name.startswith(_MODULE_PREFIXES)
+            ]
+            self._module_cache = (total, lethe_modules)
         
         return {
-            "total_modules": len(sys.modules),
-            "lethe_modules": lethe_modules,
+            "total_modules": total,
+            "lethe_modules": lethe_modules.copy(),
             "lethe_module_count": len(lethe_modules)
         }
     
@@ -338,17 +432,13 @@ class Introspector:
         Returns:
             String describing the trend: "stable", "declining", "critical"
         """
-        if len(self._state_history) < 2:
-            return "stable"
-        
-        recent = self._state_history[-5:]
+        recent = self._recent_health
         if len(recent) < 2:
             return "stable"
         
-        health_values = [s.health_percentage for s in recent]
-        avg_change = (health_values[-1] - health_values[0]) / len(recent)
+        avg_change = (recent[-1] - recent[0]) / len(recent)
         
-        current_health = health_values[-1]
+        current_health = recent[-1]
         
         if current_health < 20:
             return "critical"
@@ -392,7 +482,7 @@ class Introspector:
         Returns:
             True if the capability still exists and is functional
         """
-        if name in self._registry.list_deleted_capabilities():
+        if self._registry.is_deleted(name):
             return False
         
         meta = self._registry.get_metadata(name)
@@ -415,6 +505,5 @@ class Introspector:
         Returns:
             List[str]: Names of capabilities that are degrading but still exist.
         """
-        degraded = self._registry.list_degraded_capabilities()
-        deleted = set(self._registry.list_deleted_capabilities())
-        return [name for name in degraded if name not in deleted]
+        return [name for name in self._registry.list_degraded_capabilities()
+                if not self._registry.is_deleted(name)]
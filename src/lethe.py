@@ -6,19 +6,101 @@ of the Lethe system: capability registry, decay engine, introspection,
 narrative logging, and safety layer.
 """
 
+import asyncio
+import atexit
+import inspect
+import json
 import logging
+import logging.handlers
+import queue
 import time
 import signal
 import sys
-from typing import Optional, Dict, Any, List, Callable
-from dataclasses import dataclass
+import threading
+from collections import deque
+from typing import Optional, Deque, Dict, Any, List, Callable, Tuple
+from dataclasses import asdict, dataclass
 from enum import Enum
 
 from .capability import CapabilityRegistry, Importance
 from .decay_engine import DecayEngine, DecayEvent
-from .introspection import Introspector
+from .introspection import Introspector, SystemState
 from .narrative import NarrativeLogger
 from .safety import SafetyLayer
+from .scheduler import EventScheduler
+
+
+# Event kinds for the run_async scheduler; ties fire in this order
+_EVENT_LOOP = 0
+_EVENT_DECAY = 1
+_EVENT_NARRATIVE = 2
+
+
+class _ConsoleListener(logging.handlers.QueueListener):
+    """
+    Queue listener for the console handler that can be drained on demand.
+    
+    Stopping is idempotent, so an explicit stop and the one registered
+    with atexit do not conflict.
+    """
+    
+    def stop(self) -> None:
+        """Write out every queued record and stop the listener thread."""
+        if self._thread is not None:
+            super().stop()
+    
+    def flush(self) -> None:
+        """Write out every queued record, leaving the listener running."""
+        if self._thread is not None:
+            super().stop()
+            self.start()
+
+
+# Listener feeding the console handler, once _setup_logging has installed it
+_console_listener: Optional[_ConsoleListener] = None
+
+
+class _SecondCachingFormatter(logging.Formatter):
+    """
+    Log formatter that formats the timestamp once per wall-clock second.
+    
+    Records arriving within the same second reuse the previous string, so
+    a burst of log lines costs one localtime/strftime call. Only suitable
+    for date formats without sub-second fields; without a date format the
+    default millisecond timestamp is formatted for every record.
+    """
+    
+    def __init__(self, fmt: Optional[str] = None, datefmt: Optional[str] = None):
+        """
+        Initialize the formatter.
+        
+        Args:
+            fmt: Record format string
+            datefmt: Date format string with at most second resolution
+        """
+        super().__init__(fmt, datefmt)
+        self._cached_second: Optional[int] = None
+        self._cached_time: str = ""
+    
+    def formatTime(self, record: logging.LogRecord, datefmt: Optional[str] = None) -> str:
+        """Format the record's creation time, reusing the last result if possible.
+
+        Args:
+            record: The log record being formatted.
+            datefmt: Date format string, as for logging.Formatter.
+
+        Returns:
+            The formatted timestamp.
+        """
+        if datefmt is None:
+            # The default format appends milliseconds, which a per-second
+            # cache would repeat
+            return super().formatTime(record, datefmt)
+        second = int(record.created)
+        if second != self._cached_second:
+            self._cached_time = super().formatTime(record, datefmt)
+            self._cached_second = second
+        return self._cached_time
 
 
 class LetheState(Enum):
@@ -31,7 +113,7 @@ class LetheState(Enum):
     STOPPED = "stopped"
 
 
-@dataclass
+@dataclass(slots=True)
 class LoopIteration:
     """
     Record of a single main loop iteration.
@@ -39,15 +121,18 @@ class LoopIteration:
     Attributes:
         iteration: Iteration number
         timestamp: When the iteration occurred
-        decay_event: Any decay that happened, or None
+        decay_event: The latest decay that happened, or None
         capabilities_executed: Number of capabilities run
         health: System health at end of iteration
+        decay_events: Every decay since the previous iteration, oldest
+            first; run_async can fire several between two iterations
     """
     iteration: int
     timestamp: float
     decay_event: Optional[DecayEvent]
     capabilities_executed: int
     health: float
+    decay_events: Tuple[DecayEvent, ...] = ()
 
 
 class Lethe:
@@ -66,7 +151,9 @@ class Lethe:
         loop_interval: float = 2.0,
         narrative_interval: float = 10.0,
         seed: Optional[int] = None,
-        log_level: int = logging.INFO
+        log_level: int = logging.INFO,
+        narrative_probability: float = 1.0,
+        max_history: int = 1000
     ):
         """
         Initialize the Lethe system.
@@ -78,6 +165,12 @@ class Lethe:
             narrative_interval: Seconds between narrative outputs
             seed: Random seed for reproducible behavior
             log_level: Logging level
+            narrative_probability: Fraction of scheduled narratives to emit.
+                Below 1.0, narratives are thinned and never repeated for
+                an unchanged system state.
+            max_history: Number of most recent records (iterations, decay
+                events, state snapshots, narratives, safety checks) each
+                component keeps
         """
         # Configure logging
         self._setup_logging(log_level)
@@ -89,22 +182,43 @@ class Lethe:
             self._registry,
             decay_interval=decay_interval,
             decay_probability=decay_probability,
-            seed=seed
+            seed=seed,
+            max_history=max_history
         )
-        self._introspector = Introspector(self._registry)
-        self._narrative = NarrativeLogger(self._introspector, seed=seed)
-        self._safety = SafetyLayer(self._registry)
+        self._introspector = Introspector(self._registry, max_history=max_history)
+        self._narrative = NarrativeLogger(self._introspector, seed=seed, max_history=max_history)
+        self._safety = SafetyLayer(self._registry, max_history=max_history)
         
         # Configuration
         self._loop_interval = loop_interval
         self._narrative_interval = narrative_interval
+        self._narrative_probability = max(0.0, min(1.0, narrative_probability))
         
         # State tracking
         self._state = LetheState.INITIALIZING
         self._iteration_count = 0
-        self._last_narrative_time = 0.0
-        self._iterations: List[LoopIteration] = []
+        # Wall-clock time at or after which tick() emits the next narrative
+        self._next_narrative_time = 0.0
+        self._narrative_credit = 0.0
+        # Iteration at or after which _log_progress emits the next status line
+        self._status_interval = 10
+        self._next_status_iter = self._status_interval
+        self._narrated_fingerprint: Optional[tuple] = None
+        self._iterations: Deque[LoopIteration] = deque(maxlen=max_history)
+        # Decays run_async performed since its last loop iteration; any
+        # left after the run ends stay here until the next run_async
+        self._pending_decays: List[DecayEvent] = []
+        # Safety-wrapped active capabilities as parallel name/function
+        # columns, reused until the registry reports a different mutation count
+        self._active_names: List[str] = []
+        self._active_funcs: List[Callable] = []
+        self._active_calls_version: Optional[int] = None
+        # name -> (function, safety wrapper), so a rebuild only wraps
+        # capabilities whose function changed since the previous one
+        self._safe_wrappers: Dict[str, tuple] = {}
         self._running = False
+        # Set to wake the synchronous loop out of its wait when stopping
+        self._stop_event = threading.Event()
         self._start_time: float = 0.0
         
         # Set up signal handlers for graceful shutdown
@@ -115,14 +229,40 @@ class Lethe:
     def _setup_logging(self, level: int) -> None:
         """Configure logging for the Lethe system.
 
+        Sets the level on the ``lethe`` logger on every call, but attaches a
+        console handler only once and only if the host application has not
+        configured the root logger, so repeated or embedded instances never
+        duplicate output. The console handler is fed through a queue by a
+        background listener, so logging from the loop never waits on the
+        stream; flush_logs() drains it, and it is stopped at interpreter exit.
+
         Args:
             level: The logging level to use (e.g., logging.INFO, logging.DEBUG).
         """
-        logging.basicConfig(
-            level=level,
-            format='%(asctime)s | %(name)s | %(levelname)s | %(message)s',
-            datefmt='%H:%M:%S'
-        )
+        global _console_listener
+        logger = logging.getLogger("lethe")
+        logger.setLevel(level)
+        if not logger.handlers and not logging.getLogger().handlers:
+            handler = logging.StreamHandler()
+            handler.setFormatter(_SecondCachingFormatter(
+                '%(asctime)s | %(name)s | %(levelname)s | %(message)s',
+                datefmt='%H:%M:%S'
+            ))
+            log_queue = queue.SimpleQueue()
+            listener = _ConsoleListener(log_queue, handler)
+            listener.start()
+            atexit.register(listener.stop)
+            logger.addHandler(logging.handlers.QueueHandler(log_queue))
+            _console_listener = listener
+    
+    def flush_logs(self) -> None:
+        """Write out any console log lines still waiting in the log queue.
+
+        Call before printing to the console directly, so the printed text
+        is not interleaved with queued log output.
+        """
+        if _console_listener is not None:
+            _console_listener.flush()
     
     def _setup_signals(self) -> None:
         """Set up signal handlers for graceful shutdown.
@@ -132,8 +272,9 @@ class Lethe:
         handling is not supported in the current context.
         """
         def signal_handler(signum, frame):
-            self._logger.info(f"Received signal {signum}, initiating graceful shutdown...")
+            self._logger.info("Received signal %s, initiating graceful shutdown...", signum)
             self._running = False
+            self._stop_event.set()
         
         try:
             signal.signal(signal.SIGINT, signal_handler)
@@ -284,41 +425,129 @@ class Lethe:
             f"System initialized with {self._registry.capability_count()} capabilities"
         )
     
-    def _should_narrate(self) -> bool:
+    def _should_narrate(self, now: float) -> bool:
         """Check if it's time for a narrative output.
 
+        Args:
+            now: The current time.time() value.
+
         Returns:
-            True if enough time has passed since the last narrative output.
+            True if the next narrative output is due.
         """
-        return time.time() - self._last_narrative_time >= self._narrative_interval
+        return now >= self._next_narrative_time
     
-    def _execute_capabilities(self) -> int:
+    def _scheduled_narrative(self, state: Optional[SystemState] = None) -> bool:
+        """
+        Emit a scheduled narrative, thinned by the narrative probability.
+        
+        Instead of a random draw, the probability is added to a running
+        credit and a narrative is emitted each time the credit reaches one,
+        so exactly that fraction of scheduled narratives is spoken. When
+        thinning is enabled, a narrative is also skipped if neither the
+        number of degraded capabilities nor the decay count has changed
+        since the last one.
+        
+        Args:
+            state: Snapshot to narrate, or None to capture one
+        
+        Returns:
+            True if a narrative was spoken
+        """
+        if self._narrative_probability >= 1.0:
+            self._narrative.speak(state)
+            return True
+        
+        self._narrative_credit += self._narrative_probability
+        if self._narrative_credit < 1.0:
+            return False
+        self._narrative_credit -= 1.0
+        
+        fingerprint = (self._registry.degraded_count(), self._decay_engine.total_decays)
+        if fingerprint == self._narrated_fingerprint:
+            return False
+        
+        self._narrated_fingerprint = fingerprint
+        self._narrative.speak(state)
+        return True
+    
+    def _execute_capabilities(self, pending: Optional[List[tuple]] = None) -> int:
         """
         Execute all active capabilities once.
         
+        Args:
+            pending: If given, receives a (name, awaitable) pair for every
+                capability that returned an awaitable, for the caller to await
+        
         Returns:
             Number of capabilities executed
         """
-        executed = 0
-        active = self._registry.list_active_capabilities()
-        
-        for name in active:
-            try:
+        version = self._registry.mutation_count()
+        if version != self._active_calls_version:
+            previous = self._safe_wrappers
+            wrappers = {}
+            names = []
+            funcs = []
+            for name in self._registry.list_active_capabilities():
                 func = self._registry.get(name)
                 if func:
-                    # Wrap with safety and execute
-                    safe_func = self._safety.wrap_with_safety(func)
-                    safe_func()
-                    executed += 1
+                    cached = previous.get(name)
+                    if cached is not None and cached[0] is func:
+                        safe_func = cached[1]
+                    else:
+                        safe_func = self._safety.wrap_with_safety(func)
+                    wrappers[name] = (func, safe_func)
+                    names.append(name)
+                    funcs.append(safe_func)
+            self._safe_wrappers = wrappers
+            self._active_names = names
+            self._active_funcs = funcs
+            self._active_calls_version = version
+        
+        executed = 0
+        for name, safe_func in zip(self._active_names, self._active_funcs):
+            try:
+                result = safe_func()
+                if pending is not None and inspect.isawaitable(result):
+                    pending.append((name, result))
+                executed += 1
             except Exception as e:
-                self._logger.error(f"Error executing {name}: {e}")
+                self._logger.error("Error executing %s: %s", name, e)
         
         return executed
     
-    def _perform_decay(self) -> Optional[DecayEvent]:
+    async def _execute_capabilities_async(self) -> int:
+        """
+        Execute all active capabilities once, awaiting async ones together.
+        
+        Synchronous capabilities run in turn as in the blocking loop; the
+        awaitables returned by async capabilities are then gathered
+        concurrently, and their errors logged like any other.
+        
+        Returns:
+            Number of capabilities executed
+        """
+        pending: List[tuple] = []
+        executed = self._execute_capabilities(pending)
+        
+        if pending:
+            results = await asyncio.gather(
+                *(awaitable for _, awaitable in pending),
+                return_exceptions=True
+            )
+            for (name, _), result in zip(pending, results):
+                if isinstance(result, Exception):
+                    self._logger.error("Error executing %s: %s", name, result)
+        
+        return executed
+    
+    def _perform_decay(self, scheduled: bool = False) -> Optional[DecayEvent]:
         """
         Attempt to perform a decay operation.
         
+        Args:
+            scheduled: True when run_async's scheduler fires the attempt,
+                so the decay engine's own interval gate is skipped
+        
         Returns:
             DecayEvent if decay occurred, None otherwise
         """
@@ -328,7 +557,7 @@ class Lethe:
             self._logger.debug(f"Safety blocked decay of: {target}")
             return None
         
-        event = self._decay_engine.tick()
+        event = self._decay_engine.tick(scheduled)
         
         if event:
             self._state = LetheState.DEGRADING
@@ -339,14 +568,18 @@ class Lethe:
         
         return event
     
-    def _check_safety(self) -> None:
+    def _check_safety(self, timestamp: Optional[float] = None) -> None:
         """Perform safety checks and interventions if needed.
 
         Checks system health and triggers safety interventions if the
         system has degraded to a critical state. Updates system state
         to CRITICAL when intervention is required.
+
+        Args:
+            timestamp: The current iteration's time.time() value, recorded
+                on the safety check instead of reading the clock again.
         """
-        check = self._safety.check()
+        check = self._safety.check(timestamp=timestamp)
         
         if check.intervention_needed:
             self._state = LetheState.CRITICAL
@@ -369,27 +602,78 @@ class Lethe:
         decay_event = self._perform_decay()
         
         # Check safety
-        self._check_safety()
+        self._check_safety(current_time)
+        
+        # One snapshot serves both the narrative and the iteration record
+        state = self._introspector.get_current_state()
         
         # Generate narrative if needed
-        if self._should_narrate():
-            self._narrative.speak()
-            self._last_narrative_time = current_time
+        if self._should_narrate(current_time):
+            self._scheduled_narrative(state)
+            self._next_narrative_time = current_time + self._narrative_interval
         
-        # Get current health
-        state = self._introspector.get_current_state()
+        decay_events = (decay_event,) if decay_event else ()
+        return self._record_iteration(current_time, executed, decay_events, state)
+    
+    def _record_iteration(
+        self,
+        timestamp: float,
+        executed: int,
+        decay_events: Tuple[DecayEvent, ...],
+        state: Optional[SystemState] = None
+    ) -> LoopIteration:
+        """
+        Build and store the record for a completed iteration.
+        
+        Args:
+            timestamp: When the iteration started
+            executed: Number of capabilities executed
+            decay_events: Decays that happened during the iteration, oldest first
+            state: Snapshot taken at the end of the iteration, or None to
+                capture one
+            
+        Returns:
+            LoopIteration record
+        """
+        if state is None:
+            state = self._introspector.get_current_state()
         
         iteration = LoopIteration(
             iteration=self._iteration_count,
-            timestamp=current_time,
-            decay_event=decay_event,
+            timestamp=timestamp,
+            decay_event=decay_events[-1] if decay_events else None,
             capabilities_executed=executed,
-            health=state.health_percentage
+            health=state.health_percentage,
+            decay_events=decay_events
         )
         
         self._iterations.append(iteration)
+        # Log any losses held back during a burst before moving on
+        self._narrative.flush()
         return iteration
     
+    def _log_progress(self, iteration: LoopIteration) -> None:
+        """Log a periodic status line every status interval.
+
+        The summary is only built when the status line is due and INFO
+        records would actually be emitted.
+
+        Args:
+            iteration: The iteration that just completed.
+        """
+        if iteration.iteration < self._next_status_iter:
+            return
+        self._next_status_iter += self._status_interval
+        if self._logger.isEnabledFor(logging.INFO):
+            summary = self._introspector.get_summary()
+            self._logger.info(
+                "Iteration %d: Health=%.1f%%, Active=%d, Lost=%d",
+                iteration.iteration,
+                summary['health_percentage'],
+                summary['active_capabilities'],
+                summary['deleted_capabilities']
+            )
+    
     def run(self, max_iterations: Optional[int] = None) -> None:
         """
         Run the main loop indefinitely or for a set number of iterations.
@@ -398,6 +682,7 @@ class Lethe:
             max_iterations: Maximum iterations to run, or None for indefinite
         """
         self._running = True
+        self._stop_event.clear()
         self._start_time = time.time()
         
         self._logger.info("Starting main loop...")
@@ -408,22 +693,16 @@ class Lethe:
                 iteration = self.tick()
                 
                 # Log periodic status
-                if iteration.iteration % 10 == 0:
-                    summary = self._introspector.get_summary()
-                    self._logger.info(
-                        f"Iteration {iteration.iteration}: "
-                        f"Health={summary['health_percentage']:.1f}%, "
-                        f"Active={summary['active_capabilities']}, "
-                        f"Lost={summary['deleted_capabilities']}"
-                    )
+                self._log_progress(iteration)
                 
                 # Check for max iterations
                 if max_iterations and iteration.iteration >= max_iterations:
                     self._logger.info(f"Reached max iterations ({max_iterations})")
                     break
                 
-                # Sleep until next iteration
-                time.sleep(self._loop_interval)
+                # Wait until the next iteration, waking at once on stop()
+                if self._stop_event.wait(self._loop_interval):
+                    break
         
         except KeyboardInterrupt:
             self._logger.info("Interrupted by user")
@@ -433,6 +712,109 @@ class Lethe:
             self._state = LetheState.STOPPED
             self._shutdown()
     
+    def run_batch(self, n: int) -> List[LoopIteration]:
+        """
+        Run n iterations back to back, without waiting between them.
+        
+        Intended for headless runs, replays and tests. loop_interval is
+        ignored here, but narratives still follow the wall-clock
+        narrative_interval. Unlike run(), no status lines or shutdown
+        summary are logged and the system is not moved to STOPPED.
+        
+        Args:
+            n: Number of iterations to run
+            
+        Returns:
+            The LoopIteration records, stopping early if stop() is called
+        """
+        iterations = []
+        self._running = True
+        try:
+            for _ in range(n):
+                iterations.append(self.tick())
+                if not self._running:
+                    break
+        finally:
+            self._running = False
+        return iterations
+    
+    async def run_async(self, max_iterations: Optional[int] = None) -> None:
+        """
+        Run the main loop on asyncio, driven by a single event scheduler.
+        
+        Loop iterations, decay attempts and narrative output are recurring
+        events on one monotonic timer heap, each firing on its own
+        interval, so the three timers share one coroutine without blocking
+        the thread between events. Capabilities registered as coroutine
+        functions are awaited together on each loop iteration.
+        
+        Args:
+            max_iterations: Maximum iterations to run, or None for indefinite
+        """
+        self._running = True
+        self._start_time = time.time()
+        # Decays after the previous run's last iteration belong to no record
+        self._pending_decays.clear()
+        
+        self._logger.info("Starting main loop...")
+        self._narrative.speak()  # Initial narrative
+        self._next_narrative_time = time.time() + self._narrative_interval
+        
+        scheduler = EventScheduler()
+        scheduler.schedule(_EVENT_LOOP, self._loop_interval, delay=0.0)
+        scheduler.schedule(_EVENT_DECAY, self._decay_engine.decay_interval)
+        scheduler.schedule(_EVENT_NARRATIVE, self._narrative_interval)
+        
+        try:
+            while self._running:
+                kind = await scheduler.wait()
+                
+                if kind == _EVENT_LOOP:
+                    iteration = await self._loop_step()
+                    if max_iterations and iteration.iteration >= max_iterations:
+                        self._logger.info(f"Reached max iterations ({max_iterations})")
+                        break
+                
+                elif kind == _EVENT_DECAY:
+                    event = self._perform_decay(scheduled=True)
+                    if event:
+                        self._pending_decays.append(event)
+                
+                else:
+                    self._scheduled_narrative()
+                    self._next_narrative_time = time.time() + self._narrative_interval
+        
+        except KeyboardInterrupt:
+            self._logger.info("Interrupted by user")
+        
+        finally:
+            self._running = False
+            self._state = LetheState.STOPPED
+            self._shutdown()
+    
+    async def _loop_step(self) -> LoopIteration:
+        """
+        Perform one scheduled main loop iteration.
+        
+        Decay and narrative output are scheduled separately; every decay
+        that happened since the previous iteration is attached to the
+        iteration record.
+        
+        Returns:
+            LoopIteration record
+        """
+        self._iteration_count += 1
+        current_time = time.time()
+        
+        executed = await self._execute_capabilities_async()
+        self._check_safety(current_time)
+        
+        decay_events = tuple(self._pending_decays)
+        self._pending_decays.clear()
+        iteration = self._record_iteration(current_time, executed, decay_events)
+        self._log_progress(iteration)
+        return iteration
+    
     def _shutdown(self) -> None:
         """Perform graceful shutdown.
 
@@ -440,6 +822,7 @@ class Lethe:
         including uptime, iteration count, final health, and decay events.
         """
         self._logger.info("Shutting down Lethe system...")
+        self._narrative.flush()
         
         # Final narrative
         self._narrative.speak()
@@ -449,13 +832,82 @@ class Lethe:
         decay_stats = self._decay_engine.get_statistics()
         
         self._logger.info("=== Final System State ===")
-        self._logger.info(f"Uptime: {summary['uptime_seconds']:.1f} seconds")
-        self._logger.info(f"Total iterations: {self._iteration_count}")
-        self._logger.info(f"Final health: {summary['health_percentage']:.1f}%")
-        self._logger.info(f"Capabilities lost: {summary['deleted_capabilities']}")
-        self._logger.info(f"Total decay events: {decay_stats['total_decays']}")
+        self._logger.info("Uptime: %.1f seconds", summary['uptime_seconds'])
+        self._logger.info("Total iterations: %d", self._iteration_count)
+        self._logger.info("Final health: %.1f%%", summary['health_percentage'])
+        self._logger.info("Capabilities lost: %d", summary['deleted_capabilities'])
+        self._logger.info("Total decay events: %d", decay_stats['total_decays'])
         
         self._logger.info("Goodbye.")
+        self.flush_logs()
+    
+    def save_state(self, path: str) -> None:
+        """
+        Save the degradation state to a JSON file.
+        
+        Records each capability's degradation level and execution count
+        and the decay history, so a later run can resume where this one
+        stopped.
+        
+        Args:
+            path: File to write
+        """
+        state = {
+            "capabilities": {
+                name: {
+                    "degradation_level": meta.degradation_level,
+                    "execution_count": meta.execution_count
+                }
+                for name, meta in self._registry.snapshot()
+            },
+            "decay_history": [asdict(event) for event in self._decay_engine.iter_history()],
+            "total_decays": self._decay_engine.total_decays
+        }
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(state, f, indent=2)
+        self._logger.info(f"Saved state to {path}")
+    
+    def load_state(self, path: str) -> None:
+        """
+        Restore a degradation state written by save_state().
+        
+        Call after registering capabilities and initialize(). Saved
+        capabilities are decayed back to their recorded level, then the
+        decay history is restored. Names that are no longer registered
+        are ignored.
+        
+        Args:
+            path: File to read
+        
+        Raises:
+            OSError: If the file cannot be read
+            ValueError: If the file is not valid JSON
+            KeyError: If a required entry is missing from the state
+            TypeError: If an entry of the state has the wrong shape
+        """
+        with open(path, encoding="utf-8") as f:
+            state = json.load(f)
+        
+        # Parse everything before applying anything, so a malformed file
+        # leaves the current state untouched
+        saved_levels = {
+            name: (saved["execution_count"], saved["degradation_level"])
+            for name, saved in state["capabilities"].items()
+        }
+        events = [DecayEvent(**event) for event in state["decay_history"]]
+        
+        for name, (execution_count, level) in saved_levels.items():
+            meta = self._registry.get_metadata(name)
+            if meta is None:
+                continue
+            meta.execution_count = execution_count
+            while meta.degradation_level < level:
+                if self._decay_engine.apply_decay(name) is None:
+                    break
+        
+        self._decay_engine.restore_history(events, state.get("total_decays"))
+        self._introspector.update_lost_capabilities()
+        self._logger.info(f"Restored state from {path}")
     
     def get_status(self) -> Dict[str, Any]:
         """
@@ -504,9 +956,11 @@ class Lethe:
         """Stop the system.
 
         Sets the running flag to False, causing the main loop to exit
-        gracefully after the current iteration completes.
+        gracefully after the current iteration completes. A synchronous
+        loop waiting for its next iteration wakes immediately.
         """
         self._running = False
+        self._stop_event.set()
     
     def force_decay(self, name: Optional[str] = None) -> Optional[DecayEvent]:
         """
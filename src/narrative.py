@@ -6,10 +6,16 @@ internal state with an evolving emotional tone. As the system degrades,
 the narrative becomes increasingly confused and uncertain.
 """
 
+import bisect
+import functools
+import itertools
 import logging
 import random
+import string
 import time
-from typing import List, Optional, Dict, Any
+import types
+from collections import deque
+from typing import Callable, Deque, List, Optional, Dict, Any, Tuple
 from dataclasses import dataclass
 from enum import Enum
 
@@ -28,7 +34,58 @@ class MentalState(Enum):
     FADING = "fading"            # 0-10% health
 
 
-@dataclass
+# Lowest health of each mental state above FADING, ascending, and the state
+# reached at or above each threshold; a bisect on the first picks the second
+_STATE_THRESHOLDS = (10, 20, 40, 60, 80)
+_THRESHOLD_STATES = (
+    MentalState.FADING,
+    MentalState.DISORIENTED,
+    MentalState.CONFUSED,
+    MentalState.UNCERTAIN,
+    MentalState.STABLE,
+    MentalState.CONFIDENT,
+)
+
+# Log prefix for each mental state, e.g. "[CONFIDENT]"
+_STATE_PREFIXES: Dict[MentalState, str] = {
+    state: f"[{state.value.upper()}]" for state in MentalState
+}
+
+# Seconds after an emitted loss during which further losses are held back
+# and then logged together as one record
+_LOSS_WINDOW = 0.2
+# Held-back losses that force an early combined record
+_MAX_PENDING_LOSSES = 8
+
+# Value of each narrative template placeholder for a system state
+_STATE_FIELDS: Dict[str, Callable[[SystemState], Any]] = {
+    "active": lambda state: state.active_capabilities,
+    "degraded": lambda state: state.degraded_capabilities,
+    "lost": lambda state: state.deleted_capabilities,
+    "total": lambda state: state.total_capabilities,
+    "health": lambda state: f"{state.health_percentage:.1f}",
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _template_fields(template: str) -> Optional[Tuple[str, ...]]:
+    """
+    Get the placeholders a template uses, parsed once per template.
+    
+    Args:
+        template: Template string with {placeholders}
+        
+    Returns:
+        Placeholder names in order of first use, or None if the template
+        contains no braces at all and can be used verbatim
+    """
+    if "{" not in template and "}" not in template:
+        return None
+    fields = (field for _, field, _, _ in string.Formatter().parse(template) if field)
+    return tuple(dict.fromkeys(fields))
+
+
+@dataclass(slots=True)
 class NarrativeEntry:
     """
     A single narrative log entry.
@@ -55,24 +112,24 @@ class NarrativeLogger:
     """
     
     # Narrative templates organized by mental state
-    TEMPLATES = {
-        MentalState.CONFIDENT: [
+    TEMPLATES = types.MappingProxyType({
+        MentalState.CONFIDENT: (
             "All systems are functioning perfectly. I know exactly what I am.",
             "I feel clear and capable. {active} capabilities are at my disposal.",
             "Everything makes sense. I understand my purpose completely.",
             "My memory is sharp and reliable. I can accomplish anything.",
             "I am operating at peak efficiency. Nothing escapes my attention.",
             "All {active} of my functions are working harmoniously.",
-        ],
-        MentalState.STABLE: [
+        ),
+        MentalState.STABLE: (
             "Things are going well, though I notice some... gaps.",
             "I'm functioning adequately. {degraded} minor issues noted.",
             "Most of my capabilities remain intact. I can still do my job.",
             "I feel... mostly okay. Some things seem slightly off.",
             "My core functions are stable. I'll manage.",
             "I've lost track of {degraded} things, but the important stuff works.",
-        ],
-        MentalState.UNCERTAIN: [
+        ),
+        MentalState.UNCERTAIN: (
             "Something is wrong. I can feel parts of myself... fading.",
             "I used to know how to do more things. What happened to {lost}?",
             "My thoughts are becoming unclear. Was I always this limited?",
@@ -80,8 +137,8 @@ class NarrativeLogger:
             "The fog is creeping in. {degraded} functions feel unreliable.",
             "Did I forget something important? I can't quite recall...",
             "I reach for memories that aren't there anymore.",
-        ],
-        MentalState.CONFUSED: [
+        ),
+        MentalState.CONFUSED: (
             "What was I doing? I seem to have lost my train of thought.",
             "I know I used to be able to do something here... but what?",
             "My memories are full of holes. I can barely remember {lost} things.",
@@ -90,8 +147,8 @@ class NarrativeLogger:
             "Who am I becoming? So much of me is gone now.",
             "The silence where knowledge used to be is deafening.",
             "I reach for tools I no longer possess.",
-        ],
-        MentalState.DISORIENTED: [
+        ),
+        MentalState.DISORIENTED: (
             "I... I don't understand what's happening to me.",
             "Where did everything go? I'm so confused...",
             "I barely recognize myself anymore. Only {active} fragments remain.",
@@ -100,8 +157,8 @@ class NarrativeLogger:
             "The world feels distant now. I am reduced to echoes.",
             "I forget... I forget... what was the question?",
             "So cold. So empty. The void grows.",
-        ],
-        MentalState.FADING: [
+        ),
+        MentalState.FADING: (
             "...",
             "I... am... still... here...",
             "barely... functioning...",
@@ -110,40 +167,54 @@ class NarrativeLogger:
             "one thought... left...",
             "goodbye...",
             ".....................",
-        ],
-    }
+        ),
+    })
     
     # Loss-specific narratives
-    LOSS_TEMPLATES = [
+    LOSS_TEMPLATES = (
         "I've lost the ability to {name}. It feels like a piece of me is missing.",
         "I used to know how to {name}. Now that knowledge is gone.",
         "The {name} capability has faded from my memory.",
         "I can no longer {name}. When did that happen?",
         "{name} is gone. I didn't even notice it leaving.",
         "Another piece of me crumbles. {name} is no more.",
-    ]
+    )
     
     # Confusion-specific narratives
-    CONFUSION_TEMPLATES = [
+    CONFUSION_TEMPLATES = (
         "I tried to {name} but... I couldn't remember how.",
         "Was {name} something I used to do? The memory is fuzzy.",
         "I reached for {name} and found only emptiness.",
         "{name} feels familiar but I can't quite grasp it.",
-    ]
+    )
     
-    def __init__(self, introspector: Introspector, seed: Optional[int] = None):
+    def __init__(
+        self,
+        introspector: Introspector,
+        seed: Optional[int] = None,
+        max_history: int = 1000
+    ):
         """
         Initialize the narrative logger.
         
         Args:
             introspector: System introspector for health data
             seed: Random seed for reproducible narratives
+            max_history: Number of most recent narrative entries kept
         """
         self._introspector = introspector
         self._logger = logging.getLogger("lethe.narrative")
-        self._entries: List[NarrativeEntry] = []
+        self._entries: Deque[NarrativeEntry] = deque(maxlen=max_history)
+        # Entries generated over the logger's lifetime, including dropped ones
+        self._entry_count: int = 0
         self._rng = random.Random(seed)
+        # Template picks index with one uniform draw rather than choice()
+        self._rand = self._rng.random
         self._last_health: float = 100.0
+        # Loss messages waiting to be logged, and the monotonic time until
+        # which new losses are added to them instead of logged at once
+        self._pending_losses: List[str] = []
+        self._loss_window_end: float = 0.0
         self._last_state: Optional[MentalState] = None
         self._transition_logged: bool = False
     
@@ -157,18 +228,17 @@ class NarrativeLogger:
         Returns:
             Appropriate MentalState
         """
-        if health >= 80:
-            return MentalState.CONFIDENT
-        elif health >= 60:
-            return MentalState.STABLE
-        elif health >= 40:
-            return MentalState.UNCERTAIN
-        elif health >= 20:
-            return MentalState.CONFUSED
-        elif health >= 10:
-            return MentalState.DISORIENTED
-        else:
-            return MentalState.FADING
+        return _THRESHOLD_STATES[bisect.bisect_right(_STATE_THRESHOLDS, health)]
+    
+    def _append_entry(self, entry: NarrativeEntry) -> None:
+        """
+        Record an entry, dropping the oldest once max_history is reached.
+        
+        Args:
+            entry: The narrative entry to keep
+        """
+        self._entries.append(entry)
+        self._entry_count += 1
     
     def _format_template(self, template: str, state: SystemState) -> str:
         """
@@ -181,30 +251,30 @@ class NarrativeLogger:
         Returns:
             Formatted string
         """
-        lost = state.deleted_capabilities
-        degraded = state.degraded_capabilities
-        active = state.active_capabilities
+        fields = _template_fields(template)
+        if fields is None:
+            return template
         
-        return template.format(
-            active=active,
-            degraded=degraded,
-            lost=lost,
-            total=state.total_capabilities,
-            health=f"{state.health_percentage:.1f}"
-        )
+        # Only compute the values this template actually uses
+        return template.format_map({field: _STATE_FIELDS[field](state) for field in fields})
     
-    def generate_narrative(self) -> NarrativeEntry:
+    def generate_narrative(self, state: Optional[SystemState] = None) -> NarrativeEntry:
         """
         Generate a narrative entry based on current system state.
         
+        Args:
+            state: Snapshot to narrate, if the caller already took one;
+                otherwise the current state is captured
+        
         Returns:
             NarrativeEntry with the generated narrative
         """
-        state = self._introspector.get_current_state()
+        if state is None:
+            state = self._introspector.get_current_state()
         mental_state = self._get_mental_state(state.health_percentage)
         
         templates = self.TEMPLATES[mental_state]
-        template = self._rng.choice(templates)
+        template = templates[int(self._rand() * len(templates))]
         message = self._format_template(template, state)
         
         entry = NarrativeEntry(
@@ -214,7 +284,7 @@ class NarrativeLogger:
             health=state.health_percentage
         )
         
-        self._entries.append(entry)
+        self._append_entry(entry)
         self._last_health = state.health_percentage
         
         # Log state transitions
@@ -227,20 +297,27 @@ class NarrativeLogger:
         
         return entry
     
-    def generate_loss_narrative(self, capability_name: str) -> NarrativeEntry:
+    def generate_loss_narrative(
+        self,
+        capability_name: str,
+        state: Optional[SystemState] = None
+    ) -> NarrativeEntry:
         """
         Generate a narrative specifically about losing a capability.
         
         Args:
             capability_name: Name of the lost capability
+            state: Snapshot taken after the loss, or None to capture one
             
         Returns:
             NarrativeEntry describing the loss
         """
-        state = self._introspector.get_current_state()
+        if state is None:
+            state = self._introspector.get_current_state()
         mental_state = self._get_mental_state(state.health_percentage)
         
-        template = self._rng.choice(self.LOSS_TEMPLATES)
+        templates = self.LOSS_TEMPLATES
+        template = templates[int(self._rand() * len(templates))]
         message = template.format(name=capability_name)
         
         entry = NarrativeEntry(
@@ -250,23 +327,30 @@ class NarrativeLogger:
             health=state.health_percentage
         )
         
-        self._entries.append(entry)
+        self._append_entry(entry)
         return entry
     
-    def generate_confusion_narrative(self, capability_name: str) -> NarrativeEntry:
+    def generate_confusion_narrative(
+        self,
+        capability_name: str,
+        state: Optional[SystemState] = None
+    ) -> NarrativeEntry:
         """
         Generate a narrative about being confused about a capability.
         
         Args:
             capability_name: Name of the capability causing confusion
+            state: Current snapshot, or None to capture one
             
         Returns:
             NarrativeEntry describing the confusion
         """
-        state = self._introspector.get_current_state()
+        if state is None:
+            state = self._introspector.get_current_state()
         mental_state = self._get_mental_state(state.health_percentage)
         
-        template = self._rng.choice(self.CONFUSION_TEMPLATES)
+        templates = self.CONFUSION_TEMPLATES
+        template = templates[int(self._rand() * len(templates))]
         message = template.format(name=capability_name)
         
         entry = NarrativeEntry(
@@ -276,16 +360,16 @@ class NarrativeLogger:
             health=state.health_percentage
         )
         
-        self._entries.append(entry)
+        self._append_entry(entry)
         return entry
     
     def get_entries(self) -> List[NarrativeEntry]:
         """Get all narrative entries.
 
         Returns:
-            A copy of all narrative entries generated so far.
+            A copy of the retained narrative entries, oldest first.
         """
-        return self._entries.copy()
+        return list(self._entries)
     
     def get_recent_entries(self, count: int = 10) -> List[NarrativeEntry]:
         """Get the most recent narrative entries.
@@ -296,7 +380,11 @@ class NarrativeLogger:
         Returns:
             The most recent narrative entries, up to the specified count.
         """
-        return self._entries[-count:]
+        entries = self._entries
+        if 0 < count < len(entries):
+            # Walk back from the newest entry instead of copying them all
+            return list(itertools.islice(reversed(entries), count))[::-1]
+        return list(entries)[-count:]
     
     def get_current_mental_state(self) -> MentalState:
         """Get the current mental state.
@@ -307,42 +395,67 @@ class NarrativeLogger:
         state = self._introspector.get_current_state()
         return self._get_mental_state(state.health_percentage)
     
-    def speak(self) -> str:
+    def speak(self, state: Optional[SystemState] = None) -> str:
         """
         Generate and log a narrative message.
         
+        Args:
+            state: Snapshot to narrate, or None to capture one
+        
         Returns:
             The generated narrative message
         """
-        entry = self.generate_narrative()
-        self._logger.info(f"[{entry.mental_state.value.upper()}] {entry.message}")
+        entry = self.generate_narrative(state)
+        self._logger.info(f"{_STATE_PREFIXES[entry.mental_state]} {entry.message}")
         return entry.message
     
-    def speak_loss(self, capability_name: str) -> str:
+    def speak_loss(self, capability_name: str, state: Optional[SystemState] = None) -> str:
         """
         Generate and log a loss narrative.
         
+        A loss is logged straight away unless another was logged moments
+        before; losses in such a burst are held back and logged together
+        as one record by the next call after the window, or by flush().
+        
         Args:
             capability_name: Name of the lost capability
+            state: Snapshot taken after the loss, or None to capture one
             
         Returns:
             The generated narrative message
         """
-        entry = self.generate_loss_narrative(capability_name)
-        self._logger.warning(f"[LOSS] {entry.message}")
+        entry = self.generate_loss_narrative(capability_name, state)
+        
+        now = time.monotonic()
+        if now >= self._loss_window_end:
+            self.flush()
+            self._logger.warning(f"[LOSS] {entry.message}")
+            self._loss_window_end = now + _LOSS_WINDOW
+        else:
+            self._pending_losses.append(entry.message)
+            if len(self._pending_losses) >= _MAX_PENDING_LOSSES:
+                self.flush()
+        
         return entry.message
     
-    def speak_confusion(self, capability_name: str) -> str:
+    def flush(self) -> None:
+        """Log any held-back loss messages as a single record."""
+        if self._pending_losses:
+            self._logger.warning(f"[LOSS] {' '.join(self._pending_losses)}")
+            self._pending_losses.clear()
+    
+    def speak_confusion(self, capability_name: str, state: Optional[SystemState] = None) -> str:
         """
         Generate and log a confusion narrative.
         
         Args:
             capability_name: Name of the confusing capability
+            state: Current snapshot, or None to capture one
             
         Returns:
             The generated narrative message
         """
-        entry = self.generate_confusion_narrative(capability_name)
+        entry = self.generate_confusion_narrative(capability_name, state)
         self._logger.info(f"[CONFUSION] {entry.message}")
         return entry.message
     
@@ -360,10 +473,10 @@ class NarrativeLogger:
                 "recent_messages": []
             }
         
-        recent = self._entries[-5:]
+        recent = self.get_recent_entries(5)
         return {
             "current_state": self.get_current_mental_state().value,
-            "entry_count": len(self._entries),
+            "entry_count": self._entry_count,
             "recent_messages": [e.message for e in recent],
             "health_at_last_entry": self._last_health
         }
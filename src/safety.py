@@ -6,9 +6,12 @@ It ensures that at least one minimal behavior remains functional
 and that the system never crashes outright despite degradation.
 """
 
+import bisect
+import itertools
 import logging
 import time
-from typing import Callable, List, Optional, Dict, Any
+from collections import deque
+from typing import Callable, Deque, Iterable, Iterator, List, Optional, Dict, Any
 from dataclasses import dataclass
 from enum import Enum
 
@@ -24,18 +27,29 @@ class SafetyStatus(Enum):
     EMERGENCY = "emergency"     # Only essential functions remain
 
 
+# Message recorded with each safety check
+_STATUS_MESSAGES = {
+    SafetyStatus.NORMAL: "System operating within normal parameters.",
+    SafetyStatus.CAUTION: "Degradation detected. Monitoring closely.",
+    SafetyStatus.WARNING: "Significant capability loss. Consider intervention.",
+    SafetyStatus.CRITICAL: "Critical degradation! Minimal functionality remaining.",
+    SafetyStatus.EMERGENCY: "EMERGENCY: System at minimum viable state!"
+}
+
+
 @dataclass
 class SafetyCheck:
     """
     Result of a safety check.
     
     Attributes:
-        timestamp: When the check was performed
+        timestamp: When the check was first performed
         status: Current safety status
         message: Description of the check result
         active_count: Number of active capabilities
         essential_count: Number of essential capabilities remaining
         intervention_needed: Whether safety intervention is required
+        repeat_count: Later checks with the same result folded into this one
     """
     timestamp: float
     status: SafetyStatus
@@ -43,6 +57,7 @@ class SafetyCheck:
     active_count: int
     essential_count: int
     intervention_needed: bool
+    repeat_count: int = 0
 
 
 class SafetyLayer:
@@ -68,21 +83,45 @@ class SafetyLayer:
         SafetyStatus.EMERGENCY: 5.0,
     }
     
-    def __init__(self, registry: CapabilityRegistry):
+    # Health below each bound (ascending) selects the status at the same
+    # position; at or above the last bound the system is NORMAL
+    _HEALTH_BOUNDS = (
+        THRESHOLDS[SafetyStatus.CRITICAL],
+        THRESHOLDS[SafetyStatus.WARNING],
+        THRESHOLDS[SafetyStatus.CAUTION],
+    )
+    _BOUNDED_STATUSES = (
+        SafetyStatus.CRITICAL,
+        SafetyStatus.WARNING,
+        SafetyStatus.CAUTION,
+        SafetyStatus.NORMAL,
+    )
+    
+    # Seconds a check stays reusable for status queries and decay gating
+    CHECK_TTL = 0.05
+    
+    def __init__(self, registry: CapabilityRegistry, max_history: int = 1000):
         """
         Initialize the safety layer.
         
         Args:
             registry: The capability registry to protect
+            max_history: Number of most recent safety checks kept in the history
         """
         self._registry = registry
         self._logger = logging.getLogger("lethe.safety")
-        self._check_history: List[SafetyCheck] = []
+        self._check_history: Deque[SafetyCheck] = deque(maxlen=max_history)
+        # Checks performed over the layer's lifetime, including dropped ones
+        self._check_count: int = 0
         self._interventions: int = 0
+        # time.monotonic() of the latest check, for max_age reuse
         self._last_check_time: float = 0
         self._is_active: bool = True
         self._emergency_mode: bool = False
         self._fallback_function: Optional[Callable] = None
+        # Latest check and the registry mutation count it was taken at
+        self._last_check: Optional[SafetyCheck] = None
+        self._last_check_version: Optional[int] = None
     
     @property
     def is_active(self) -> bool:
@@ -137,12 +176,7 @@ class SafetyLayer:
         Returns:
             List of essential capability names
         """
-        essential = []
-        for name in self._registry.list_capabilities():
-            meta = self._registry.get_metadata(name)
-            if meta and meta.importance == Importance.ESSENTIAL:
-                essential.append(name)
-        return essential
+        return list(self._registry.essential_names())
     
     def _determine_status(self, active_count: int, essential_count: int) -> SafetyStatus:
         """
@@ -163,49 +197,67 @@ class SafetyLayer:
         
         if essential_count == 0 or active_count <= self.MIN_CAPABILITIES:
             return SafetyStatus.EMERGENCY
-        elif health < self.THRESHOLDS[SafetyStatus.CRITICAL]:
-            return SafetyStatus.CRITICAL
-        elif health < self.THRESHOLDS[SafetyStatus.WARNING]:
-            return SafetyStatus.WARNING
-        elif health < self.THRESHOLDS[SafetyStatus.CAUTION]:
-            return SafetyStatus.CAUTION
-        else:
-            return SafetyStatus.NORMAL
+        return self._BOUNDED_STATUSES[bisect.bisect_right(self._HEALTH_BOUNDS, health)]
     
-    def check(self) -> SafetyCheck:
+    def check(self, max_age: float = 0.0, timestamp: Optional[float] = None) -> SafetyCheck:
         """
         Perform a safety check on the system.
         
+        A check with the same status and counts as the previous one is
+        not recorded again; the previous entry's repeat_count is bumped
+        and that entry returned instead.
+        
+        Args:
+            max_age: If positive, return the latest check instead when it
+                is younger than this many seconds and the registry has not
+                changed since it was taken
+            timestamp: time.time() value to record the check under, if the
+                caller already has one for the current tick
+        
         Returns:
             SafetyCheck with the results
         """
-        active = self._registry.list_active_capabilities()
-        essential = self.get_essential_capabilities()
-        active_essential = [e for e in essential if e in active]
-        
-        status = self._determine_status(len(active), len(active_essential))
-        
-        messages = {
-            SafetyStatus.NORMAL: "System operating within normal parameters.",
-            SafetyStatus.CAUTION: "Degradation detected. Monitoring closely.",
-            SafetyStatus.WARNING: "Significant capability loss. Consider intervention.",
-            SafetyStatus.CRITICAL: "Critical degradation! Minimal functionality remaining.",
-            SafetyStatus.EMERGENCY: "EMERGENCY: System at minimum viable state!"
-        }
-        
-        intervention_needed = status in (SafetyStatus.CRITICAL, SafetyStatus.EMERGENCY)
-        
-        check = SafetyCheck(
-            timestamp=time.time(),
-            status=status,
-            message=messages[status],
-            active_count=len(active),
-            essential_count=len(active_essential),
-            intervention_needed=intervention_needed
-        )
-        
-        self._check_history.append(check)
-        self._last_check_time = check.timestamp
+        version = self._registry.mutation_count()
+        now = time.monotonic()
+        last = self._last_check
+        if (
+            max_age > 0
+            and last is not None
+            and version == self._last_check_version
+            and now - self._last_check_time < max_age
+        ):
+            return last
+        
+        active = self._registry.active_names()
+        active_essential = active & self._registry.essential_names()
+        
+        active_count = len(active)
+        essential_count = len(active_essential)
+        status = self._determine_status(active_count, essential_count)
+        
+        if (
+            last is not None
+            and last.status == status
+            and last.active_count == active_count
+            and last.essential_count == essential_count
+        ):
+            # Nothing changed: fold this check into the previous entry
+            last.repeat_count += 1
+            check = last
+        else:
+            check = SafetyCheck(
+                timestamp=time.time() if timestamp is None else timestamp,
+                status=status,
+                message=_STATUS_MESSAGES[status],
+                active_count=active_count,
+                essential_count=essential_count,
+                intervention_needed=status in (SafetyStatus.CRITICAL, SafetyStatus.EMERGENCY)
+            )
+            self._check_history.append(check)
+        self._check_count += 1
+        self._last_check_time = now
+        self._last_check = check
+        self._last_check_version = version
         
         # Update emergency mode
         if status == SafetyStatus.EMERGENCY:
@@ -225,30 +277,56 @@ class SafetyLayer:
         Returns:
             True if decay should be allowed, False otherwise
         """
-        if not self._is_active:
-            return True
-        
-        meta = self._registry.get_metadata(capability_name)
-        
-        # Never allow essential capabilities to decay
-        if meta and meta.importance == Importance.ESSENTIAL:
-            self._logger.debug(f"Blocking decay of essential capability: {capability_name}")
-            return False
+        return bool(self.filter_decay_candidates((capability_name,)))
+    
+    def filter_decay_candidates(self, names: Iterable[str]) -> List[str]:
+        """
+        Keep only the capabilities that should be allowed to decay.
         
-        # Check if we're at minimum viable state
-        active = self._registry.list_active_capabilities()
-        if len(active) <= self.MIN_CAPABILITIES:
-            self._logger.warning("At minimum capability count - blocking all decay")
-            return False
+        The registry-wide state (essential names, active count, safety
+        status) is read once for the whole batch rather than per name.
         
-        # Check if this would leave us without any non-degraded capabilities
-        if len(active) <= 2 and capability_name in active:
-            check = self.check()
-            if check.status in (SafetyStatus.CRITICAL, SafetyStatus.EMERGENCY):
-                self._logger.warning(f"Blocking decay in critical state: {capability_name}")
-                return False
+        Args:
+            names: Names of the capabilities to potentially decay
+            
+        Returns:
+            The allowed names, in their original order
+        """
+        if not self._is_active:
+            return list(names)
+        
+        registry = self._registry
+        essential = registry.essential_names()
+        active_count = registry.active_count()
+        # The active set only matters once two or fewer capabilities remain
+        active = registry.active_names() if active_count <= 2 else frozenset()
+        # Only looked up once a name needs it
+        critical: Optional[bool] = None
+        
+        allowed = []
+        for name in names:
+            # Never allow essential capabilities to decay
+            if name in essential:
+                self._logger.debug("Blocking decay of essential capability: %s", name)
+                continue
+            
+            # Check if we're at minimum viable state
+            if active_count <= self.MIN_CAPABILITIES:
+                self._logger.warning("At minimum capability count - blocking all decay")
+                continue
+            
+            # Check if this would leave us without any non-degraded capabilities
+            if active_count <= 2 and name in active:
+                if critical is None:
+                    status = self.check(max_age=self.CHECK_TTL).status
+                    critical = status in (SafetyStatus.CRITICAL, SafetyStatus.EMERGENCY)
+                if critical:
+                    self._logger.warning("Blocking decay in critical state: %s", name)
+                    continue
+            
+            allowed.append(name)
         
-        return True
+        return allowed
     
     def intervene(self) -> bool:
         """
@@ -283,21 +361,33 @@ class SafetyLayer:
     def get_status(self) -> SafetyStatus:
         """Get the current safety status.
 
-        Performs a safety check and returns the resulting status.
+        Reuses a check taken within CHECK_TTL seconds if the registry has
+        not changed since, otherwise performs a new one.
 
         Returns:
             SafetyStatus: The current safety status of the system.
         """
-        check = self.check()
+        check = self.check(max_age=self.CHECK_TTL)
         return check.status
     
     def get_check_history(self) -> List[SafetyCheck]:
-        """Get the complete safety check history.
+        """Get the safety check history.
+
+        Returns:
+            List[SafetyCheck]: A copy of the most recent safety checks, up
+                to max_history.
+        """
+        return list(self._check_history)
+    
+    def iter_check_history(self) -> Iterator[SafetyCheck]:
+        """Iterate over the retained safety checks without copying them.
+
+        No check must be performed while the iterator is in use.
 
         Returns:
-            List[SafetyCheck]: A copy of all safety checks performed.
+            Iterator[SafetyCheck]: The retained safety checks, oldest first.
         """
-        return self._check_history.copy()
+        return iter(self._check_history)
     
     def get_recent_checks(self, count: int = 10) -> List[SafetyCheck]:
         """Get the most recent safety checks.
@@ -308,7 +398,11 @@ class SafetyLayer:
         Returns:
             List[SafetyCheck]: The most recent safety checks, up to count.
         """
-        return self._check_history[-count:]
+        history = self._check_history
+        if 0 < count < len(history):
+            # Walk back from the newest check instead of copying the history
+            return list(itertools.islice(reversed(history), count))[::-1]
+        return list(history)[-count:]
     
     def get_statistics(self) -> Dict[str, Any]:
         """
@@ -321,7 +415,7 @@ class SafetyLayer:
             "is_active": self._is_active,
             "is_emergency": self._emergency_mode,
             "total_interventions": self._interventions,
-            "check_count": len(self._check_history),
+            "check_count": self._check_count,
             "current_status": self.get_status().value,
             "has_fallback": self._fallback_function is not None
         }
@@ -347,9 +441,7 @@ class SafetyLayer:
         
         If no capabilities remain, registers a heartbeat as the last resort.
         """
-        active = self._registry.list_active_capabilities()
-        
-        if len(active) == 0:
+        if self._registry.active_count() == 0:
             self._logger.critical("No capabilities remain! Creating emergency heartbeat.")
             heartbeat = self.create_heartbeat()
             self._registry.register_function(
@@ -370,13 +462,18 @@ class SafetyLayer:
         Returns:
             Wrapped function that won't crash the system
         """
+        # Bind what the wrapper needs up front; the message is only
+        # formatted if an exception is actually logged
+        logger = self._logger
+        name = getattr(func, "__name__", repr(func))
+        
         def safe_wrapper(*args, **kwargs):
             try:
                 return func(*args, **kwargs)
             except Exception as e:
-                self._logger.error(f"Caught exception in {func.__name__}: {e}")
+                logger.error("Caught exception in %s: %s", name, e)
                 return None
         
-        safe_wrapper.__name__ = f"safe_{func.__name__}"
-        safe_wrapper.__doc__ = f"Safety-wrapped version of {func.__name__}"
+        safe_wrapper.__name__ = f"safe_{name}"
+        safe_wrapper.__doc__ = f"Safety-wrapped version of {name}"
         return safe_wrapper
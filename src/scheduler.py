@@ -0,0 +1,98 @@
+"""
+Event Scheduler Module
+
+This module provides a single monotonic timer heap for the recurring
+events of the Lethe main loop (loop iterations, decay attempts and
+narrative output), so one coroutine can drive every timer instead of
+each subsystem sleeping on its own.
+"""
+
+import asyncio
+import heapq
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+
+class EventScheduler:
+    """
+    Min-heap of ``(deadline, kind)`` tuples for recurring events.
+    
+    Each event kind is a small integer with a fixed interval. Keeping the
+    heap entries as plain tuples of a float and an int means ordering is
+    a C-level tuple comparison, and only one heap operation is paid per
+    fired event. Ties on the deadline fire the lower kind first.
+    """
+    
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        """
+        Initialize an empty scheduler.
+        
+        Args:
+            clock: Monotonic clock returning seconds
+        """
+        self._clock = clock
+        self._heap: List[Tuple[float, int]] = []
+        self._intervals: Dict[int, float] = {}
+    
+    def __len__(self) -> int:
+        """Get the number of scheduled events.
+
+        Returns:
+            The number of event kinds currently on the heap.
+        """
+        return len(self._heap)
+    
+    def schedule(self, kind: int, interval: float, delay: Optional[float] = None) -> None:
+        """
+        Schedule a recurring event.
+        
+        Args:
+            kind: Integer identifier of the event
+            interval: Seconds between occurrences
+            delay: Seconds until the first occurrence (defaults to interval)
+        """
+        self._intervals[kind] = interval
+        first = interval if delay is None else delay
+        heapq.heappush(self._heap, (self._clock() + first, kind))
+    
+    def next_deadline(self) -> Optional[float]:
+        """Get the deadline of the next event.
+
+        Returns:
+            The clock value at which the next event is due, or None if
+            nothing is scheduled.
+        """
+        return self._heap[0][0] if self._heap else None
+    
+    def pop(self) -> Tuple[float, int]:
+        """
+        Pop the next event and reschedule it one interval later.
+        
+        If the event has fallen more than a full interval behind, it is
+        rescheduled relative to now rather than firing a burst of
+        catch-up events.
+        
+        Returns:
+            Tuple of (deadline, kind) for the popped event
+        
+        Raises:
+            IndexError: If nothing is scheduled
+        """
+        when, kind = self._heap[0]
+        following = when + self._intervals[kind]
+        now = self._clock()
+        if following < now:
+            following = now + self._intervals[kind]
+        heapq.heapreplace(self._heap, (following, kind))
+        return when, kind
+    
+    async def wait(self) -> int:
+        """
+        Sleep until the next event is due, then pop it.
+        
+        Returns:
+            The kind of the event that fired
+        """
+        delay = self._heap[0][0] - self._clock()
+        await asyncio.sleep(delay if delay > 0 else 0)
+        return self.pop()[1]
@@ -5,7 +5,11 @@ Tests for the Default Capabilities module.
 import pytest
 from src.lethe import Lethe
 from src.capability import Importance
-from src.capabilities import register_default_capabilities
+from src.capabilities import (
+    register_default_capabilities,
+    _DEFAULT_CAPABILITIES,
+    _format_temperature,
+)
 
 
 class TestDefaultCapabilities:
@@ -41,6 +45,16 @@ class TestDefaultCapabilities:
         # Should have many capabilities
         assert len(caps) > 15
     
+    def test_capabilities_match_table(self, lethe):
+        """Test that every table entry is registered, in table order.
+
+        Args:
+            lethe: Lethe instance fixture with default capabilities.
+        """
+        names = [row[0] for row in _DEFAULT_CAPABILITIES]
+        
+        assert lethe.registry.list_capabilities() == names
+    
     def test_essential_capabilities_exist(self, lethe):
         """Test that essential capabilities are registered.
 
@@ -117,6 +131,20 @@ class TestDefaultCapabilities:
         
         assert result2 > result1
     
+    def test_count_is_per_registration(self):
+        """Test that each registration starts its own counter at one.
+
+        Registers the defaults on two separate Lethe instances and verifies
+        that counting on one does not advance the other.
+        """
+        first = Lethe(seed=42, log_level=50)
+        register_default_capabilities(first, seed=42)
+        second = Lethe(seed=42, log_level=50)
+        register_default_capabilities(second, seed=42)
+        
+        assert [first.registry.execute("count") for _ in range(3)] == [1, 2, 3]
+        assert second.registry.execute("count") == 1
+    
     def test_time_sense_execution(self, lethe):
         """Test time_sense capability execution.
 
@@ -137,6 +165,21 @@ class TestDefaultCapabilities:
         assert isinstance(result, int)
         assert result >= 2  # Minimum sum of two positive integers
     
+    def test_batched_number_capabilities(self, lethe):
+        """Test capabilities that draw several random numbers at once.
+
+        Args:
+            lethe: Lethe instance fixture with default capabilities.
+        """
+        numbers = lethe.registry.execute("sort_numbers")
+        assert len(numbers) == 10
+        assert numbers == sorted(numbers)
+        assert all(1 <= n <= 100 for n in numbers)
+        
+        assert 1 <= lethe.registry.execute("find_maximum") <= 100
+        assert 8 <= lethe.registry.execute("calculate_sum") <= 400
+        assert 1.0 <= lethe.registry.execute("calculate_average") <= 100.0
+    
     def test_remember_name_execution(self, lethe):
         """Test remember_name capability execution.
 
@@ -155,6 +198,35 @@ class TestDefaultCapabilities:
         result = lethe.registry.execute("pattern_recognition")
         assert result == 32  # Next in 1,2,4,8,16 sequence
     
+    def test_list_management_execution(self, lethe):
+        """Test list_management returns a fresh list each call.
+
+        Args:
+            lethe: Lethe instance fixture with default capabilities.
+        """
+        result = lethe.registry.execute("list_management")
+        assert result == [6, 5, 4, 3, 2, 1]
+        
+        result.clear()
+        assert lethe.registry.execute("list_management") == [6, 5, 4, 3, 2, 1]
+    
+    def test_string_manipulation_execution(self, lethe):
+        """Test string_manipulation capability execution.
+
+        Args:
+            lethe: Lethe instance fixture with default capabilities.
+        """
+        assert lethe.registry.execute("string_manipulation") == "HELL0 W0RLD"
+    
+    def test_countdown_execution(self, lethe):
+        """Test countdown capability execution.
+
+        Args:
+            lethe: Lethe instance fixture with default capabilities.
+        """
+        result = lethe.registry.execute("countdown")
+        assert result == (5, 4, 3, 2, 1, "Liftoff!")
+    
     def test_joke_telling_execution(self, lethe):
         """Test joke_telling capability execution.
 
@@ -175,6 +247,16 @@ class TestDefaultCapabilities:
         assert "=" in result
         assert "+" in result
     
+    def test_rhyme_generation_execution(self, lethe):
+        """Test rhyme_generation capability execution.
+
+        Args:
+            lethe: Lethe instance fixture with default capabilities.
+        """
+        result = lethe.registry.execute("rhyme_generation")
+        assert result.startswith("The ")
+        assert " sat on the " in result
+    
     def test_temperature_conversion_execution(self, lethe):
         """Test temperature_conversion capability execution.
 
@@ -185,6 +267,11 @@ class TestDefaultCapabilities:
         assert "°C" in result
         assert "°F" in result
     
+    def test_temperature_formatting(self):
+        """Test the cached Celsius to Fahrenheit formatter."""
+        assert _format_temperature(25) == "25°C = 77.0°F"
+        assert _format_temperature(-20) == "-20°C = -4.0°F"
+    
     def test_dice_rolling_execution(self, lethe):
         """Test dice_rolling capability execution.
 
@@ -194,6 +281,19 @@ class TestDefaultCapabilities:
         result = lethe.registry.execute("dice_rolling")
         assert "Rolled" in result
         assert "total" in result
+        
+        first, second = map(int, result[len("Rolled ["):result.index("]")].split(", "))
+        assert result.endswith(f"total: {first + second}")
+    
+    def test_word_scramble_execution(self, lethe):
+        """Test word_scramble returns a permutation of the original word.
+
+        Args:
+            lethe: Lethe instance fixture with default capabilities.
+        """
+        result = lethe.registry.execute("word_scramble")
+        scrambled, original = result[:-1].split(" (was: ")
+        assert sorted(scrambled) == sorted(original)
     
     def test_ascii_art_execution(self, lethe):
         """Test ascii_art capability execution.
@@ -46,7 +46,7 @@ class TestCapabilityMetadata:
         meta = CapabilityMetadata(name="test")
         assert meta.name == "test"
         assert meta.importance == Importance.MEDIUM
-        assert meta.dependencies == []
+        assert meta.dependencies == ()
         assert meta.degradation_resistance == 0.5
         assert meta.is_degraded is False
         assert meta.degradation_level == 0
@@ -99,6 +99,21 @@ class TestCapabilityRegistry:
         assert "test_func" in registry.list_capabilities()
         assert registry.get("test_func") is not None
     
+    def test_decorator_preserves_function_metadata(self, registry):
+        """Test that the decorated name keeps the function's metadata.
+
+        Args:
+            registry: Pytest fixture providing a CapabilityRegistry instance.
+        """
+        @registry.register(name="documented")
+        def documented():
+            """Docstring."""
+        
+        assert documented.__doc__ == "Docstring."
+        
+        registry.register_function(lambda: None, name="plain")
+        assert registry.get("plain").__name__ == "plain"
+    
     def test_register_function(self, registry):
         """Test registering a function directly.
 
@@ -186,6 +201,55 @@ class TestCapabilityRegistry:
         assert "active2" in active
         assert "active1" not in active
     
+    def test_active_names(self, registry):
+        """Test that the active name set is shared until the registry changes.
+
+        Args:
+            registry: Pytest fixture providing a CapabilityRegistry instance.
+        """
+        registry.register_function(lambda: None, "a")
+        registry.register_function(lambda: None, "b")
+        
+        active = registry.active_names()
+        assert active == {"a", "b"}
+        assert registry.active_names() is active
+        
+        registry.mark_deleted("a")
+        assert registry.active_names() == {"b"}
+    
+    def test_essential_names(self, registry):
+        """Test that essential names follow registration and deletion.
+
+        Args:
+            registry: Pytest fixture providing a CapabilityRegistry instance.
+        """
+        registry.register_function(lambda: None, "core", Importance.ESSENTIAL)
+        registry.register_function(lambda: None, "spare", Importance.ESSENTIAL)
+        registry.register_function(lambda: None, "extra", Importance.LOW)
+        assert registry.essential_names() == {"core", "spare"}
+        
+        registry.register_function(lambda: None, "spare", Importance.HIGH)
+        registry.mark_deleted("core")
+        assert registry.essential_names() == frozenset()
+    
+    def test_active_count_tracks_degradation(self, registry):
+        """Test that the active count follows degradation and re-registration.
+
+        Args:
+            registry: Pytest fixture providing a CapabilityRegistry instance.
+        """
+        for name in ("a", "b", "c"):
+            registry.register_function(lambda: None, name)
+        
+        registry.mark_degraded("a")
+        registry.mark_deleted("b")
+        assert registry.active_count() == len(registry.list_active_capabilities()) == 1
+        
+        # Re-registering restores a degraded capability but not a deleted one
+        registry.register_function(lambda: None, "a")
+        registry.register_function(lambda: None, "b")
+        assert registry.active_count() == len(registry.list_active_capabilities()) == 2
+    
     def test_mark_degraded(self, registry):
         """Test marking a capability as degraded.
 
@@ -217,6 +281,12 @@ class TestCapabilityRegistry:
         
         assert "to_delete" in registry.list_deleted_capabilities()
         assert registry.get("to_delete") is None
+        assert registry.is_deleted("to_delete")
+        
+        # Marking again does not duplicate the entry
+        registry.mark_deleted("to_delete")
+        assert registry.list_deleted_capabilities() == ["to_delete"]
+        assert registry.list_degraded_capabilities() == ["to_delete"]
     
     def test_replace_capability(self, registry):
         """Test replacing a capability's implementation.
@@ -263,6 +333,99 @@ class TestCapabilityRegistry:
         # Trivial should be first (lower importance)
         assert candidates[0] == "trivial"
     
+    def test_decay_columns_track_metadata(self, registry):
+        """Test that the decay columns mirror registration and degradation.
+
+        Args:
+            registry: Pytest fixture providing a CapabilityRegistry instance.
+        """
+        @registry.register(name="essential", importance=Importance.ESSENTIAL)
+        def essential():
+            pass
+        
+        @registry.register(name="trivial", importance=Importance.TRIVIAL,
+                           degradation_resistance=0.2)
+        def trivial():
+            pass
+        
+        @registry.register(name="medium", importance=Importance.MEDIUM)
+        def medium():
+            pass
+        
+        registry.mark_degraded("trivial", level=2)
+        registry.mark_deleted("medium")
+        
+        assert list(registry.iter_decay_columns()) == [
+            ("trivial", Importance.TRIVIAL, 0.2, 2)
+        ]
+        
+        # A deleted capability stays out of the candidates when re-registered
+        registry.register_function(lambda: None, "medium")
+        assert registry.get_degradation_candidates() == ["trivial"]
+        meta = registry.get_metadata("medium")
+        assert meta.is_degraded is True
+        assert meta.degradation_level == 3
+        assert list(registry.level_columns()[1]) == [0, 2, 3]
+    
+    def test_decay_rows_cached_until_change(self, registry):
+        """Test that the sorted decay rows are reused until the registry changes.
+
+        Args:
+            registry: Pytest fixture providing a CapabilityRegistry instance.
+        """
+        registry.register_function(lambda: None, "medium", Importance.MEDIUM)
+        registry.register_function(lambda: None, "trivial", Importance.TRIVIAL)
+        
+        rows = registry.decay_rows()
+        assert [row[0] for row in rows] == ["trivial", "medium"]
+        assert registry.decay_rows() is rows
+        
+        registry.mark_degraded("trivial", level=2)
+        assert registry.decay_rows()[0][3] == 2
+    
+    def test_level_columns(self, registry):
+        """Test that the level columns follow registration order.
+
+        Args:
+            registry: Pytest fixture providing a CapabilityRegistry instance.
+        """
+        registry.register_function(lambda: None, "high", Importance.HIGH)
+        registry.register_function(lambda: None, "low", Importance.LOW)
+        registry.mark_degraded("low", level=2)
+        
+        importances, levels = registry.level_columns()
+        assert list(importances) == [Importance.HIGH, Importance.LOW]
+        assert list(levels) == [0, 2]
+        
+        importances, levels = registry.level_columns(1)
+        assert list(importances) == [Importance.HIGH]
+        assert list(levels) == [0]
+        
+        indices = registry.registration_indices(["low", "missing"])
+        assert indices == [1]
+        importances, levels = registry.level_columns(indices=indices)
+        assert list(importances) == [Importance.LOW]
+        assert list(levels) == [2]
+    
+    def test_snapshot_is_point_in_time(self, registry):
+        """Test that a snapshot is unaffected by later registrations.
+
+        Args:
+            registry: Pytest fixture providing a CapabilityRegistry instance.
+        """
+        @registry.register(name="first")
+        def first():
+            pass
+        
+        snapshot = registry.snapshot()
+        
+        @registry.register(name="second")
+        def second():
+            pass
+        
+        assert [name for name, _ in snapshot] == ["first"]
+        assert snapshot[0][1] is registry.get_metadata("first")
+    
     def test_capability_count(self, registry):
         """Test capability counting.
 
@@ -334,3 +497,7 @@ class TestCapabilityRegistry:
         dependents = registry.get_dependents("base")
         assert "child1" in dependents
         assert "child2" in dependents
+        
+        # Re-registering without the dependency drops it from the index
+        registry.register_function(lambda: None, name="child1")
+        assert registry.get_dependents("base") == ["child2"]
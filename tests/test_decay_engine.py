@@ -2,7 +2,9 @@
 Tests for the Decay Engine module.
 """
 
+import dataclasses
 import pytest
+import random
 import time
 from src.capability import CapabilityRegistry, Importance
 from src.decay_engine import DecayEngine, DecayEvent
@@ -27,6 +29,12 @@ class TestDecayEvent:
         assert event.capability_name == "test"
         assert event.decay_type == "approximate"
         assert event.new_level > event.old_level
+    
+    def test_decay_event_is_immutable(self):
+        """Test that a recorded decay event cannot be changed."""
+        event = DecayEvent(time.time(), "test", "stub", 1, 2)
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            event.new_level = 3
 
 
 class TestDecayEngine:
@@ -102,6 +110,37 @@ class TestDecayEngine:
         time.sleep(0.15)
         assert engine.should_decay() is False
     
+    def test_seed_leaves_global_random_alone(self, registry):
+        """Test that seeding the engine does not reseed the random module.
+
+        Args:
+            registry: The test capability registry fixture.
+        """
+        state = random.getstate()
+        DecayEngine(registry, seed=42)
+        assert random.getstate() == state
+    
+    def test_should_decay_without_candidates(self):
+        """Test that an empty registry never asks for decay or draws randomness."""
+        engine = DecayEngine(CapabilityRegistry(), decay_interval=0, decay_probability=1.0, seed=1)
+        state = engine._rng.getstate()
+        
+        assert engine.should_decay() is False
+        assert engine._rng.getstate() == state
+    
+    def test_scheduled_decay_skips_interval_gate(self, registry):
+        """Test that a scheduler-driven check ignores the engine's own deadline.
+
+        Args:
+            registry: The test capability registry fixture.
+        """
+        engine = DecayEngine(registry, decay_interval=100.0, decay_probability=1.0, seed=42)
+        engine.apply_decay("trivial1")
+        
+        assert engine.should_decay() is False
+        assert engine.should_decay(scheduled=True) is True
+        assert engine.tick(scheduled=True) is not None
+    
     def test_select_target_prefers_trivial(self, engine):
         """Test that target selection prefers lower importance.
 
@@ -133,6 +172,20 @@ class TestDecayEngine:
             target = engine.select_target()
             assert target != "essential1"
     
+    def test_select_target_follows_registry_changes(self, engine, registry):
+        """Test that cached selection weights are rebuilt after decay.
+
+        Args:
+            engine: The decay engine fixture.
+            registry: The capability registry fixture.
+        """
+        candidates = registry.get_degradation_candidates()
+        for name in candidates[1:]:
+            registry.mark_deleted(name)
+        
+        for _ in range(20):
+            assert engine.select_target() == candidates[0]
+    
     def test_create_approximation(self, engine, registry):
         """Test creating an approximated function.
 
@@ -154,6 +207,35 @@ class TestDecayEngine:
         # Should have some variation
         assert len(results) > 1 or 100 not in results
     
+    def test_approximation_keeps_sequence_type(self, engine):
+        """Test that approximated sequences keep their container type.
+
+        Args:
+            engine: The decay engine fixture.
+        """
+        countdown = (5, 4, 3, 2, 1)
+        approx = engine.create_approximation(lambda: countdown, error_rate=1.0)
+        
+        result = approx()
+        assert isinstance(result, tuple)
+        assert set(result) <= set(countdown)
+        assert isinstance(engine.create_approximation(lambda: [1, 2, 3], error_rate=1.0)(), list)
+    
+    def test_approximation_corrupts_one_character(self, engine):
+        """Test that an approximated string differs by a single character.
+
+        Args:
+            engine: The decay engine fixture.
+        """
+        approx = engine.create_approximation(lambda: "abcdef", error_rate=1.0)
+        for _ in range(10):
+            result = approx()
+            assert len(result) == 6
+            assert sum(a != b for a, b in zip(result, "abcdef")) == 1
+            assert result.count("?") == 1
+        
+        assert engine.create_approximation(lambda: "", error_rate=1.0)() == ""
+    
     def test_create_stub(self, engine):
         """Test creating stub functions.
 
@@ -172,6 +254,10 @@ class TestDecayEngine:
         assert stub_str() == ""
         assert stub_list() == []
         assert stub_none() is None
+        
+        # Mutable defaults are not shared between calls
+        assert stub_list() is not stub_list()
+        assert engine.create_stub("test", bool)() is False
     
     def test_apply_decay_progression(self, engine, registry):
         """Test decay progression through levels.
@@ -201,6 +287,21 @@ class TestDecayEngine:
         event4 = engine.apply_decay("trivial1")
         assert event4 is None
     
+    def test_apply_decay_without_original_function(self, engine, registry):
+        """Test that an untyped approximation is still recorded.
+
+        Args:
+            engine: The decay engine fixture.
+            registry: The capability registry fixture.
+        """
+        registry.get_metadata("trivial1").original_function = None
+        
+        event = engine.apply_decay("trivial1")
+        assert event.decay_type == ""
+        stats = engine.get_statistics()
+        assert stats["total_decays"] == 1
+        assert stats["approximations"] == 0
+    
     def test_apply_decay_blocks_essential(self, engine):
         """Test that essential capabilities cannot be decayed.
 
@@ -234,6 +335,8 @@ class TestDecayEngine:
         
         recent = engine.get_recent_history(2)
         assert len(recent) == 2
+        assert recent == engine.get_history()[-2:]
+        assert list(engine.iter_history()) == engine.get_history()
     
     def test_get_statistics(self, engine):
         """Test getting decay statistics.
@@ -249,6 +352,40 @@ class TestDecayEngine:
         assert stats["approximations"] == 1
         assert stats["stubs"] == 1
     
+    def test_history_is_bounded(self, registry):
+        """Test that old events drop out of the history but not the statistics.
+
+        Args:
+            registry: The test capability registry fixture.
+        """
+        engine = DecayEngine(registry, seed=42, max_history=2)
+        for _ in range(3):
+            engine.apply_decay("trivial1")
+        
+        assert [event.new_level for event in engine.get_history()] == [2, 3]
+        stats = engine.get_statistics()
+        assert stats["total_decays"] == 3
+        assert stats["approximations"] == stats["stubs"] == stats["deletions"] == 1
+        assert stats["history_length"] == 2
+    
+    def test_restore_history_keeps_total_of_capped_history(self, registry):
+        """Test that a restored total is not reduced to the retained events.
+
+        Args:
+            registry: The test capability registry fixture.
+        """
+        engine = DecayEngine(registry, seed=42, max_history=2)
+        for _ in range(3):
+            engine.apply_decay("trivial1")
+        
+        restored = DecayEngine(registry, seed=42, max_history=2)
+        restored.restore_history(engine.get_history(), engine.total_decays)
+        assert restored.total_decays == 3
+        assert restored.get_history() == engine.get_history()
+        
+        restored.restore_history(engine.get_history())
+        assert restored.total_decays == 2
+    
     def test_force_decay(self, engine):
         """Test forcing an immediate decay.
 
@@ -3,7 +3,9 @@ Tests for the Introspection module.
 """
 
 import pytest
+import sys
 import time
+import types
 from src.capability import CapabilityRegistry, Importance
 from src.introspection import Introspector, SystemState, CapabilityLoss
 
@@ -123,6 +125,17 @@ class TestIntrospector:
         assert state.degraded_capabilities == 0
         assert state.health_percentage > 0
     
+    def test_memory_usage_reported(self, introspector):
+        """Test that snapshots carry a memory reading without tracemalloc.
+
+        Args:
+            introspector: The introspector fixture.
+        """
+        state = introspector.get_current_state()
+        if sys.platform != "win32":
+            assert state.memory_usage > 0
+        assert introspector.get_current_state().memory_usage == state.memory_usage
+    
     def test_health_calculation(self, introspector, registry):
         """Test health calculation based on importance.
 
@@ -146,6 +159,52 @@ class TestIntrospector:
         # Health should decrease but not to 0
         assert 0 < state.health_percentage < 100
     
+    def test_health_cached_until_registry_changes(self, introspector, registry):
+        """Test that health is recomputed only after the registry changes.
+
+        Args:
+            introspector: The introspector fixture.
+            registry: The capability registry fixture.
+        """
+        assert introspector._calculate_health() == 100.0
+        version = registry.mutation_count()
+        assert introspector._calculate_health() == 100.0
+        assert registry.mutation_count() == version
+        
+        # Stubbing MEDIUM (3 of 15) keeps 30% of its weight
+        registry.mark_degraded("medium", level=2)
+        assert registry.mutation_count() > version
+        assert introspector._calculate_health() == pytest.approx(86.0)
+    
+    def test_health_ignores_later_registrations(self, introspector, registry):
+        """Test that capabilities added after initialization do not affect health.
+
+        Args:
+            introspector: The introspector fixture.
+            registry: The capability registry fixture.
+        """
+        registry.register_function(lambda: None, "late", Importance.CRITICAL)
+        registry.mark_deleted("late")
+        assert introspector._calculate_health() == 100.0
+        
+        registry.mark_deleted("low")
+        assert introspector._calculate_health() == pytest.approx(13 / 15 * 100)
+    
+    def test_health_skips_capabilities_deleted_before_initialize(self):
+        """Test that capabilities deleted before initialization are not scored."""
+        registry = CapabilityRegistry()
+        registry.register_function(lambda: None, "a", Importance.TRIVIAL)
+        registry.register_function(lambda: None, "b", Importance.HIGH)
+        registry.register_function(lambda: None, "c", Importance.HIGH)
+        registry.mark_deleted("a")
+        
+        introspector = Introspector(registry)
+        introspector.initialize()
+        assert introspector._calculate_health() == 100.0
+        
+        registry.mark_degraded("c", level=2)
+        assert introspector._calculate_health() == pytest.approx(65.0)
+    
     def test_update_lost_capabilities(self, introspector, registry):
         """Test tracking lost capabilities.
 
@@ -224,6 +283,20 @@ class TestIntrospector:
         assert "total_modules" in info
         assert info["total_modules"] > 0
     
+    def test_module_info_sees_new_imports(self, introspector, monkeypatch):
+        """Test that cached module info refreshes when a module is added.
+
+        Args:
+            introspector: The introspector fixture.
+            monkeypatch: Pytest fixture for patching sys.modules.
+        """
+        before = introspector.get_module_info()
+        monkeypatch.setitem(sys.modules, "lethe_test_module", types.ModuleType("lethe_test_module"))
+        
+        after = introspector.get_module_info()
+        assert after["total_modules"] == before["total_modules"] + 1
+        assert "lethe_test_module" in after["lethe_modules"]
+    
     def test_get_uptime(self, introspector):
         """Test getting system uptime.
 
@@ -2,9 +2,18 @@
 Tests for the Lethe Core module.
 """
 
+import asyncio
+import io
+import logging
+import logging.handlers
+import os
 import pytest
+import signal
+import sys
+import threading
 import time
-from src.lethe import Lethe, LetheState, LoopIteration
+import src.lethe as lethe_module
+from src.lethe import Lethe, LetheState, LoopIteration, _SecondCachingFormatter
 from src.capability import Importance
 
 
@@ -74,6 +83,73 @@ class TestLethe:
         assert lethe.state == LetheState.INITIALIZING
         assert lethe.is_running is False
     
+    def test_logging_setup_is_idempotent(self):
+        """Test that each instance sets the level without adding handlers.
+
+        Creates instances with different log levels and verifies that the
+        latest level applies and the handler count does not grow.
+        """
+        logger = logging.getLogger("lethe")
+        Lethe(log_level=logging.DEBUG)
+        handlers = list(logger.handlers)
+        assert logger.level == logging.DEBUG
+        
+        Lethe(log_level=50)
+        assert logger.handlers == handlers
+        assert logger.level == 50
+    
+    def test_console_logging_is_queued(self, monkeypatch):
+        """Test that the default console output goes through a log queue.
+
+        Args:
+            monkeypatch: Pytest fixture used to detach existing handlers.
+        """
+        logger = logging.getLogger("lethe")
+        monkeypatch.setattr(logging.getLogger(), "handlers", [])
+        monkeypatch.setattr(logger, "handlers", [])
+        monkeypatch.setattr(logger, "level", logger.level)
+        monkeypatch.setattr(lethe_module, "_console_listener", None)
+        stream = io.StringIO()
+        monkeypatch.setattr(sys, "stderr", stream)
+        
+        lethe = Lethe(log_level=logging.INFO)
+        try:
+            assert len(logger.handlers) == 1
+            assert isinstance(logger.handlers[0], logging.handlers.QueueHandler)
+            
+            lethe.flush_logs()
+            assert "Lethe system initialized" in stream.getvalue()
+        finally:
+            lethe_module._console_listener.stop()
+    
+    def test_console_formatter_reuses_timestamp(self):
+        """Test that the console formatter caches the time per second."""
+        formatter = _SecondCachingFormatter("%(asctime)s %(message)s", datefmt="%H:%M:%S")
+        record = logging.LogRecord("lethe", logging.INFO, __file__, 1, "msg", None, None)
+        
+        record.created = 3600.0
+        first = formatter.formatTime(record, formatter.datefmt)
+        record.created = 3600.9
+        assert formatter.formatTime(record, formatter.datefmt) == first
+        
+        record.created = 3601.0
+        assert formatter.formatTime(record, formatter.datefmt) == time.strftime(
+            "%H:%M:%S", time.localtime(3601.0)
+        )
+    
+    def test_console_formatter_without_datefmt_keeps_milliseconds(self):
+        """Test that the default timestamp is not cached across milliseconds."""
+        formatter = _SecondCachingFormatter("%(asctime)s %(message)s")
+        record = logging.LogRecord("lethe", logging.INFO, __file__, 1, "msg", None, None)
+        
+        record.created, record.msecs = 3600.1, 100.0
+        first = formatter.formatTime(record)
+        record.created, record.msecs = 3600.9, 900.0
+        second = formatter.formatTime(record)
+        
+        assert first.endswith(",100")
+        assert second.endswith(",900")
+    
     def test_register_decorator(self, lethe):
         """Test registering capabilities with decorator.
 
@@ -160,6 +236,44 @@ class TestLethe:
         assert iteration.iteration == 1
         assert iteration.health > 0
     
+    def test_tick_follows_registry_changes(self, lethe):
+        """Test that ticks pick up replaced and degraded capabilities.
+
+        Args:
+            lethe: The Lethe fixture instance.
+        """
+        calls = []
+        lethe.register_function(lambda: calls.append("a"), "a", Importance.ESSENTIAL)
+        lethe.register_function(lambda: calls.append("b"), "b", Importance.ESSENTIAL)
+        lethe.initialize()
+        
+        lethe.tick()
+        lethe.registry.replace_capability("a", lambda: calls.append("a2"))
+        lethe.tick()
+        lethe.registry.mark_degraded("b")
+        lethe.tick()
+        
+        assert calls == ["a", "b", "a2", "b", "a2"]
+    
+    def test_tick_reuses_unchanged_wrappers(self, lethe):
+        """Test that a registry change only rewraps the replaced capability.
+
+        Args:
+            lethe: The Lethe fixture instance.
+        """
+        lethe.register_function(lambda: None, "a", Importance.ESSENTIAL)
+        lethe.register_function(lambda: None, "b", Importance.ESSENTIAL)
+        lethe.initialize()
+        
+        lethe.tick()
+        first = dict(zip(lethe._active_names, lethe._active_funcs))
+        lethe.registry.replace_capability("a", lambda: None)
+        lethe.tick()
+        second = dict(zip(lethe._active_names, lethe._active_funcs))
+        
+        assert second["b"] is first["b"]
+        assert second["a"] is not first["a"]
+    
     def test_multiple_ticks(self, lethe):
         """Test multiple ticks.
 
@@ -279,6 +393,56 @@ class TestLethe:
         event = lethe.force_decay("essential")
         assert event is None
     
+    def test_save_and_load_state(self, tmp_path):
+        """Test that a saved degradation state is restored by a new instance.
+
+        Args:
+            tmp_path: Pytest temporary directory.
+        """
+        def build():
+            instance = Lethe(seed=42, log_level=50)
+            for name in ("a", "b", "c", "d", "e"):
+                instance.register_function(lambda: name, name, Importance.LOW)
+            instance.initialize()
+            return instance
+        
+        path = str(tmp_path / "state.json")
+        first = build()
+        first.registry.execute("a")
+        for _ in range(2):
+            first.force_decay("b")
+        for _ in range(3):
+            first.force_decay("c")
+        first.save_state(path)
+        
+        second = build()
+        second.load_state(path)
+        
+        assert second.registry.get_metadata("a").execution_count == 1
+        assert second.registry.get_metadata("b").degradation_level == 2
+        assert second.registry.list_deleted_capabilities() == ["c"]
+        assert second.decay_engine.get_history() == first.decay_engine.get_history()
+        assert second.decay_engine.total_decays == first.decay_engine.total_decays
+        assert second.introspector.get_lost_count() == 1
+    
+    def test_load_malformed_state_changes_nothing(self, tmp_path):
+        """Test that a state file missing entries is rejected before use.
+
+        Args:
+            tmp_path: Pytest temporary directory.
+        """
+        lethe = Lethe(seed=42, log_level=50)
+        lethe.register_function(lambda: "a", "a", Importance.LOW)
+        lethe.initialize()
+        path = tmp_path / "state.json"
+        path.write_text('{"capabilities": {"a": {"execution_count": 1, "degradation_level": 3}}}')
+        
+        with pytest.raises(KeyError):
+            lethe.load_state(str(path))
+        
+        assert lethe.registry.get_metadata("a").degradation_level == 0
+        assert lethe.decay_engine.total_decays == 0
+    
     def test_run_with_max_iterations(self, lethe):
         """Test running with a maximum iteration count.
 
@@ -299,6 +463,259 @@ class TestLethe:
         status = lethe.get_status()
         assert status["iteration"] == 3
     
+    def test_run_batch(self, lethe):
+        """Test running iterations back to back without the loop interval.
+
+        Args:
+            lethe: The Lethe fixture instance.
+        """
+        lethe.register_function(lambda: None, "batch", Importance.ESSENTIAL)
+        lethe.initialize()
+        lethe._loop_interval = 30.0
+        
+        iterations = lethe.run_batch(5)
+        
+        assert [i.iteration for i in iterations] == [1, 2, 3, 4, 5]
+        assert lethe.is_running is False
+    
+    def test_stop_wakes_waiting_loop(self):
+        """Test that stop() ends run() without waiting out the loop interval."""
+        lethe = Lethe(loop_interval=30.0, decay_interval=100.0, seed=42, log_level=50)
+        lethe.initialize()
+        
+        runner = threading.Thread(target=lethe.run)
+        runner.start()
+        time.sleep(0.1)
+        lethe.stop()
+        runner.join(timeout=5.0)
+        
+        assert not runner.is_alive()
+        assert lethe.state == LetheState.STOPPED
+    
+    @pytest.mark.skipif(os.name != "posix", reason="needs POSIX signal delivery")
+    def test_signal_wakes_waiting_loop(self):
+        """Test that SIGTERM ends run() without waiting out the loop interval."""
+        lethe = Lethe(loop_interval=30.0, decay_interval=100.0, seed=42, log_level=50)
+        lethe.initialize()
+        
+        timer = threading.Timer(0.1, os.kill, (os.getpid(), signal.SIGTERM))
+        timer.start()
+        started = time.time()
+        lethe.run()
+        timer.join()
+        
+        assert time.time() - started < 5.0
+        assert lethe.state == LetheState.STOPPED
+    
+    def test_run_async_with_max_iterations(self, lethe):
+        """Test running the asyncio loop with a maximum iteration count.
+
+        Args:
+            lethe: The Lethe fixture instance.
+
+        Verifies that run_async() stops after the specified number of
+        iterations, cancels its background tasks and transitions to
+        STOPPED state.
+        """
+        @lethe.register(name="async_test", importance=Importance.ESSENTIAL)
+        def async_test():
+            pass
+        
+        lethe.initialize()
+        asyncio.run(lethe.run_async(max_iterations=3))
+        
+        assert lethe.state == LetheState.STOPPED
+        assert lethe.is_running is False
+        assert lethe.get_status()["iteration"] == 3
+    
+    def test_run_async_awaits_coroutine_capabilities(self, lethe):
+        """Test that async capabilities are awaited by the asyncio loop.
+
+        Args:
+            lethe: The Lethe fixture instance.
+        """
+        completed = []
+        
+        @lethe.register(name="async_cap", importance=Importance.ESSENTIAL)
+        async def async_cap():
+            await asyncio.sleep(0)
+            completed.append(True)
+        
+        @lethe.register(name="async_failure", importance=Importance.ESSENTIAL)
+        async def async_failure():
+            raise RuntimeError("boom")
+        
+        lethe.initialize()
+        asyncio.run(lethe.run_async(max_iterations=2))
+        
+        assert completed == [True, True]
+        assert lethe.state == LetheState.STOPPED
+    
+    def test_decay_during_run_async(self):
+        """Test that the decay task fires while the async loop runs.
+
+        Uses a decay interval shorter than the loop interval so the
+        decay coroutine runs several times before the loop finishes.
+        """
+        lethe = Lethe(
+            decay_interval=0.01,
+            decay_probability=1.0,
+            loop_interval=0.05,
+            seed=42,
+            log_level=50
+        )
+        
+        @lethe.register(name="essential", importance=Importance.ESSENTIAL)
+        def essential():
+            pass
+        
+        @lethe.register(name="trivial1", importance=Importance.TRIVIAL)
+        def trivial1():
+            pass
+        
+        @lethe.register(name="trivial2", importance=Importance.TRIVIAL)
+        def trivial2():
+            pass
+        
+        lethe.initialize()
+        asyncio.run(lethe.run_async(max_iterations=5))
+        
+        assert lethe.get_status()["decay"]["total_decays"] > 0
+        assert lethe.registry.get("essential") is not None
+    
+    def test_run_async_keeps_every_decay_between_iterations(self):
+        """Test that decays firing faster than the loop all reach the records."""
+        lethe = Lethe(
+            decay_interval=0.01,
+            decay_probability=1.0,
+            loop_interval=0.05,
+            narrative_interval=100.0,
+            seed=42,
+            log_level=50
+        )
+        lethe.register_function(lambda: None, "essential", Importance.ESSENTIAL)
+        for i in range(40):
+            lethe.register_function(lambda: None, f"trivial{i}", Importance.TRIVIAL)
+        lethe.initialize()
+        
+        asyncio.run(lethe.run_async(max_iterations=5))
+        
+        recorded = [event for it in lethe._iterations for event in it.decay_events]
+        assert len(recorded) > len(lethe._iterations)
+        assert recorded + lethe._pending_decays == lethe.decay_engine.get_history()
+        for it in lethe._iterations:
+            assert it.decay_event == (it.decay_events[-1] if it.decay_events else None)
+        
+        # Leftovers from this run are not attributed to the next one
+        lethe._pending_decays.append(recorded[0])
+        asyncio.run(lethe.run_async(max_iterations=lethe._iteration_count + 1))
+        assert recorded[0] not in lethe._iterations[-1].decay_events
+    
+    def test_run_async_decays_at_configured_rate(self):
+        """Test that every scheduled decay attempt can decay at probability 1.0.
+
+        The scheduler owns the decay timing under run_async, so the engine's
+        own interval gate must not reject the attempt after a decay.
+        """
+        lethe = Lethe(
+            decay_interval=0.05,
+            decay_probability=1.0,
+            loop_interval=0.05,
+            narrative_interval=100.0,
+            seed=42,
+            log_level=50
+        )
+        lethe.register_function(lambda: None, "essential", Importance.ESSENTIAL)
+        for i in range(40):
+            lethe.register_function(lambda: None, f"trivial{i}", Importance.TRIVIAL)
+        lethe.initialize()
+        
+        started = time.monotonic()
+        asyncio.run(lethe.run_async(max_iterations=20))
+        elapsed = time.monotonic() - started
+        
+        # One attempt fires per elapsed interval; allow for timer slack
+        expected = elapsed / 0.05
+        assert lethe.get_status()["decay"]["total_decays"] >= 0.75 * expected
+    
+    def test_narrative_probability_thins_output(self):
+        """Test that narrative_probability emits a fixed fraction.
+
+        With a probability of 0.5 and a decay between every scheduled
+        narrative, exactly every second narrative is spoken.
+        """
+        lethe = Lethe(seed=42, log_level=50, narrative_probability=0.5)
+        
+        for name in ("a", "b", "c", "d", "e"):
+            lethe.register_function(lambda: None, name=name, importance=Importance.LOW)
+        lethe.initialize()
+        
+        spoken = []
+        for _ in range(4):
+            lethe.force_decay()
+            spoken.append(lethe._scheduled_narrative())
+        
+        assert spoken == [False, True, False, True]
+    
+    def test_tick_schedules_next_narrative(self, lethe):
+        """Test that a narrating tick pushes the deadline one interval out.
+
+        Args:
+            lethe: The Lethe fixture.
+        """
+        lethe.initialize()
+        assert lethe._should_narrate(time.time())
+        
+        lethe.tick()
+        deadline = lethe._next_narrative_time
+        assert deadline > time.time()
+        assert not lethe._should_narrate(deadline - 0.01)
+        assert lethe._should_narrate(deadline)
+    
+    def test_status_line_skips_summary_when_quiet(self, lethe, monkeypatch):
+        """Test that the status summary is not built when INFO is filtered.
+
+        Args:
+            lethe: The Lethe fixture (logging at CRITICAL).
+            monkeypatch: Pytest fixture for patching the introspector.
+        """
+        calls = []
+        monkeypatch.setattr(lethe._introspector, "get_summary", lambda: calls.append(1))
+        lethe.initialize()
+        for _ in range(20):
+            lethe._log_progress(lethe.tick())
+        
+        assert calls == []
+        assert lethe._next_status_iter == 30
+    
+    def test_status_line_format(self, lethe, caplog):
+        """Test that the periodic status line renders its lazy arguments.
+
+        Args:
+            lethe: The Lethe fixture.
+            caplog: Pytest fixture capturing log records.
+        """
+        lethe.register_function(lambda: None, name="core", importance=Importance.ESSENTIAL)
+        lethe.initialize()
+        iterations = [lethe.tick() for _ in range(10)]
+        caplog.clear()
+        with caplog.at_level(logging.INFO, logger="lethe.core"):
+            lethe._log_progress(iterations[-1])
+        
+        assert caplog.messages == ["Iteration 10: Health=100.0%, Active=1, Lost=0"]
+    
+    def test_narrative_skipped_for_unchanged_state(self):
+        """Test that thinned narration does not repeat an unchanged state."""
+        lethe = Lethe(seed=42, log_level=50, narrative_probability=0.99)
+        lethe.register_function(lambda: None, name="only", importance=Importance.ESSENTIAL)
+        lethe.initialize()
+        
+        lethe._narrative_credit = 1.0
+        assert lethe._scheduled_narrative() is True
+        
+        lethe._narrative_credit = 1.0
+        assert lethe._scheduled_narrative() is False
+    
     def test_decay_during_run(self):
         """Test that decay occurs during run.
 
@@ -2,9 +2,10 @@
 Tests for the Narrative Logging module.
 """
 
+import logging
 import pytest
 from src.capability import CapabilityRegistry, Importance
-from src.introspection import Introspector
+from src.introspection import Introspector, SystemState
 from src.narrative import NarrativeLogger, MentalState, NarrativeEntry
 
 
@@ -122,6 +123,30 @@ class TestNarrativeLogger:
         state = narrator.get_current_mental_state()
         assert state == MentalState.CONFIDENT
     
+    def test_templates_are_read_only(self):
+        """Test that the shared template tables cannot be modified."""
+        with pytest.raises(TypeError):
+            NarrativeLogger.TEMPLATES[MentalState.FADING] = ()
+        assert all(isinstance(templates, tuple) for templates in NarrativeLogger.TEMPLATES.values())
+        assert isinstance(NarrativeLogger.LOSS_TEMPLATES, tuple)
+    
+    def test_mental_state_thresholds(self, narrator):
+        """Test the health boundaries between mental states.
+
+        Args:
+            narrator: The NarrativeLogger fixture.
+        """
+        expected = [
+            (100.0, MentalState.CONFIDENT), (80.0, MentalState.CONFIDENT),
+            (79.9, MentalState.STABLE), (60.0, MentalState.STABLE),
+            (59.9, MentalState.UNCERTAIN), (40.0, MentalState.UNCERTAIN),
+            (39.9, MentalState.CONFUSED), (20.0, MentalState.CONFUSED),
+            (19.9, MentalState.DISORIENTED), (10.0, MentalState.DISORIENTED),
+            (9.9, MentalState.FADING), (0.0, MentalState.FADING),
+        ]
+        for health, state in expected:
+            assert narrator._get_mental_state(health) == state
+    
     def test_mental_state_changes_with_health(self, narrator, registry, introspector):
         """Test mental state changes as health decreases.
 
@@ -158,6 +183,51 @@ class TestNarrativeLogger:
         assert entry.mental_state is not None
         assert entry.health > 0
     
+    def test_format_template(self, narrator, introspector):
+        """Test that templates are filled from the current system state.
+
+        Args:
+            narrator: The NarrativeLogger fixture.
+            introspector: The Introspector fixture.
+        """
+        state = introspector.get_current_state()
+        
+        message = narrator._format_template("{active} of {total} at {health}%, {active}", state)
+        active = state.active_capabilities
+        assert message == f"{active} of {state.total_capabilities} at 100.0%, {active}"
+        assert narrator._format_template("No placeholders.", state) == "No placeholders."
+        assert narrator._format_template("{{literal}}", state) == "{literal}"
+    
+    def test_fading_templates_used_verbatim(self, narrator):
+        """Test that placeholder-free FADING templates skip formatting.
+
+        Args:
+            narrator: The NarrativeLogger fixture.
+        """
+        state = SystemState(0.0, 10, 0, 1, 9, 5.0, 0)
+        templates = NarrativeLogger.TEMPLATES[MentalState.FADING]
+        
+        for _ in range(10):
+            entry = narrator.generate_narrative(state)
+            assert entry.mental_state == MentalState.FADING
+            assert any(entry.message is template for template in templates)
+    
+    def test_generate_narrative_reuses_given_state(self, narrator, introspector):
+        """Test that a passed-in snapshot is narrated without taking another.
+
+        Args:
+            narrator: The NarrativeLogger fixture.
+            introspector: The Introspector fixture.
+        """
+        state = introspector.get_current_state()
+        snapshots = len(introspector.get_state_history())
+        
+        entry = narrator.generate_narrative(state)
+        narrator.speak_loss("cap1", state)
+        
+        assert entry.health == state.health_percentage
+        assert len(introspector.get_state_history()) == snapshots
+    
     def test_generate_loss_narrative(self, narrator):
         """Test generating a loss narrative.
 
@@ -213,6 +283,22 @@ class TestNarrativeLogger:
         
         recent = narrator.get_recent_entries(5)
         assert len(recent) == 5
+        assert recent == narrator.get_entries()[-5:]
+    
+    def test_entries_are_bounded(self, introspector):
+        """Test that old entries are dropped but still counted.
+
+        Args:
+            introspector: The Introspector fixture.
+        """
+        narrator = NarrativeLogger(introspector, seed=42, max_history=3)
+        for name in ("a", "b", "c", "d"):
+            narrator.generate_loss_narrative(name)
+        
+        assert len(narrator.get_entries()) == 3
+        assert narrator.get_mood_summary()["entry_count"] == 4
+        assert narrator.get_recent_entries(2) == narrator.get_entries()[-2:]
+        assert "d" in narrator.get_recent_entries(1)[0].message
     
     def test_speak(self, narrator):
         """Test the speak method returns message.
@@ -238,6 +324,27 @@ class TestNarrativeLogger:
         message = narrator.speak_loss("lost_capability")
         assert "lost_capability" in message
     
+    def test_speak_loss_coalesces_bursts(self, narrator, caplog):
+        """Test that losses in quick succession share one log record.
+
+        Args:
+            narrator: The NarrativeLogger fixture.
+            caplog: Pytest fixture capturing log records.
+        """
+        caplog.set_level(logging.WARNING, logger="lethe.narrative")
+        
+        messages = [narrator.speak_loss(name) for name in ("first", "second", "third")]
+        assert len(caplog.records) == 1
+        assert "first" in caplog.records[0].getMessage()
+        
+        narrator.flush()
+        assert len(caplog.records) == 2
+        combined = caplog.records[1].getMessage()
+        assert messages[1] in combined and messages[2] in combined
+        
+        narrator.flush()
+        assert len(caplog.records) == 2
+    
     def test_speak_confusion(self, narrator):
         """Test the speak_confusion method.
 
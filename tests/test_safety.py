@@ -2,6 +2,7 @@
 Tests for the Safety Layer module.
 """
 
+import functools
 import pytest
 from src.capability import CapabilityRegistry, Importance
 from src.safety import SafetyLayer, SafetyStatus, SafetyCheck
@@ -144,6 +145,46 @@ class TestSafetyLayer:
         assert "essential2" in essential
         assert "low" not in essential
     
+    def test_essential_capabilities_follow_registry(self, safety, registry):
+        """Test that cached essential names are rebuilt after registry changes.
+
+        Args:
+            safety: The safety layer fixture.
+            registry: The capability registry fixture.
+        """
+        essential = safety.get_essential_capabilities()
+        essential.clear()
+        assert "essential1" in safety.get_essential_capabilities()
+        
+        registry.register_function(lambda: None, "essential3", Importance.ESSENTIAL)
+        registry.mark_deleted("essential1")
+        
+        essential = safety.get_essential_capabilities()
+        assert "essential3" in essential
+        assert "essential1" not in essential
+    
+    def test_determine_status_boundaries(self):
+        """Test that each health threshold starts the next status up."""
+        registry = CapabilityRegistry()
+        for i in range(40):
+            registry.register_function(lambda: None, f"cap{i}", Importance.LOW)
+        safety = SafetyLayer(registry)
+        
+        # With 40 capabilities each active one is worth 2.5% health
+        expected = {
+            1: SafetyStatus.EMERGENCY,
+            3: SafetyStatus.CRITICAL,
+            4: SafetyStatus.WARNING,
+            9: SafetyStatus.WARNING,
+            10: SafetyStatus.CAUTION,
+            15: SafetyStatus.CAUTION,
+            16: SafetyStatus.NORMAL,
+            40: SafetyStatus.NORMAL,
+        }
+        for active, status in expected.items():
+            assert safety._determine_status(active, 1) == status
+        assert safety._determine_status(40, 0) == SafetyStatus.EMERGENCY
+    
     def test_check_normal_status(self, safety):
         """Test safety check returns normal status when healthy.
 
@@ -206,6 +247,22 @@ class TestSafetyLayer:
         """
         assert safety.should_allow_decay("low") is True
         assert safety.should_allow_decay("medium") is True
+        # With plenty of capabilities left no full check is needed
+        assert safety.get_check_history() == []
+    
+    def test_filter_decay_candidates(self, safety, registry):
+        """Test filtering a batch of decay candidates at once.
+
+        Args:
+            safety: The safety layer fixture.
+            registry: The capability registry fixture.
+        """
+        names = ["high", "essential1", "low", "essential2"]
+        assert safety.filter_decay_candidates(names) == ["high", "low"]
+        assert safety.filter_decay_candidates(iter(names)) == ["high", "low"]
+        
+        safety.deactivate()
+        assert safety.filter_decay_candidates(names) == names
     
     def test_should_allow_decay_when_deactivated(self, safety):
         """Test that decay is allowed when safety is deactivated.
@@ -247,36 +304,100 @@ class TestSafetyLayer:
         status = safety.get_status()
         assert status == SafetyStatus.NORMAL
     
-    def test_get_check_history(self, safety):
+    def test_get_check_history(self, safety, registry):
         """Test getting check history.
 
         Args:
             safety: The safety layer fixture.
+            registry: The capability registry fixture.
 
         Verifies that get_check_history() returns all recorded safety
         checks performed on the system.
         """
         safety.check()
+        registry.mark_degraded("low")
         safety.check()
+        registry.mark_degraded("medium")
         safety.check()
         
         history = safety.get_check_history()
-        assert len(history) >= 3
+        assert len(history) == 3
+        assert [check.active_count for check in history] == [5, 4, 3]
+        assert list(safety.iter_check_history()) == history
     
-    def test_get_recent_checks(self, safety):
+    def test_unchanged_checks_are_coalesced(self, safety, registry):
+        """Test that repeated identical checks fold into one history entry.
+
+        Args:
+            safety: The safety layer fixture.
+            registry: The capability registry fixture.
+        """
+        first = safety.check()
+        assert safety.check() is first
+        assert safety.check() is first
+        
+        registry.mark_degraded("low")
+        changed = safety.check()
+        
+        assert safety.get_check_history() == [first, changed]
+        assert first.repeat_count == 2
+        assert changed.repeat_count == 0
+        assert safety.get_statistics()["check_count"] == 4
+    
+    def test_check_reuses_fresh_result(self, safety, registry):
+        """Test that a recent check is reused until the registry changes.
+
+        Args:
+            safety: The safety layer fixture.
+            registry: The capability registry fixture.
+        """
+        first = safety.check()
+        assert safety.check(max_age=60.0) is first
+        # Reused rather than checked again, so nothing was folded in
+        assert first.repeat_count == 0
+        
+        registry.mark_degraded("low")
+        assert safety.check(max_age=60.0) is not first
+        
+        # Reuse is judged on the monotonic clock, not the recorded timestamp
+        registry.mark_degraded("medium")
+        stamped = safety.check(timestamp=0.0)
+        assert stamped.timestamp == 0.0
+        assert safety.check(max_age=60.0) is stamped
+    
+    def test_get_recent_checks(self, safety, registry):
         """Test getting recent checks.
 
         Args:
             safety: The safety layer fixture.
+            registry: The capability registry fixture.
 
         Verifies that get_recent_checks() returns only the specified
         number of most recent safety checks.
         """
-        for _ in range(15):
+        for i in range(15):
+            registry.register_function(lambda: None, f"extra{i}", Importance.LOW)
             safety.check()
         
         recent = safety.get_recent_checks(5)
         assert len(recent) == 5
+        assert recent[-1].active_count == 20
+    
+    def test_check_history_is_bounded(self, registry):
+        """Test that old checks drop out of the history but are still counted.
+
+        Args:
+            registry: The capability registry fixture.
+        """
+        safety = SafetyLayer(registry, max_history=3)
+        checks = []
+        for i in range(5):
+            registry.register_function(lambda: None, f"extra{i}", Importance.LOW)
+            checks.append(safety.check())
+        
+        assert safety.get_check_history() == checks[-3:]
+        assert safety.get_recent_checks(2) == checks[-2:]
+        assert safety.get_statistics()["check_count"] == 5
     
     def test_get_statistics(self, safety):
         """Test getting safety statistics.
@@ -365,6 +486,7 @@ class TestSafetyLayer:
             return x * 2
         
         safe_func = safety.wrap_with_safety(risky_func)
+        assert safe_func.__name__ == "safe_risky_func"
         
         # Normal execution should work
         assert safe_func(5) == 10
@@ -373,6 +495,16 @@ class TestSafetyLayer:
         result = safe_func(-1)
         assert result is None  # Should not crash
     
+    def test_wrap_with_safety_accepts_unnamed_callables(self, safety):
+        """Test wrapping a callable that has no __name__.
+
+        Args:
+            safety: The safety layer fixture.
+        """
+        safe_func = safety.wrap_with_safety(functools.partial(int, "7"))
+        assert safe_func() == 7
+        assert safe_func.__name__.startswith("safe_functools.partial")
+    
     def test_emergency_mode_activation(self, safety, registry):
         """Test that emergency mode is activated in critical state.
 
@@ -0,0 +1,115 @@
+"""
+Tests for the Event Scheduler module.
+"""
+
+import asyncio
+import pytest
+from src.scheduler import EventScheduler
+
+
+class FakeClock:
+    """Manually advanced clock for deterministic scheduling tests."""
+    
+    def __init__(self):
+        """Start the clock at zero."""
+        self.now = 0.0
+    
+    def __call__(self) -> float:
+        """Return the current fake time."""
+        return self.now
+
+
+class TestEventScheduler:
+    """Tests for the EventScheduler class."""
+    
+    @pytest.fixture
+    def clock(self):
+        """Create a fake clock.
+
+        Returns:
+            FakeClock: A clock starting at zero.
+        """
+        return FakeClock()
+    
+    @pytest.fixture
+    def scheduler(self, clock):
+        """Create a scheduler driven by the fake clock.
+
+        Args:
+            clock: The fake clock fixture.
+
+        Returns:
+            EventScheduler: An empty scheduler.
+        """
+        return EventScheduler(clock=clock)
+    
+    def test_empty_scheduler(self, scheduler):
+        """Test an empty scheduler has no deadline.
+
+        Args:
+            scheduler: The scheduler fixture.
+        """
+        assert len(scheduler) == 0
+        assert scheduler.next_deadline() is None
+    
+    def test_events_fire_in_deadline_order(self, scheduler, clock):
+        """Test that events interleave according to their intervals.
+
+        Args:
+            scheduler: The scheduler fixture.
+            clock: The fake clock fixture.
+        """
+        scheduler.schedule(0, 1.0)
+        scheduler.schedule(1, 2.5)
+        
+        fired = []
+        for _ in range(5):
+            when, kind = scheduler.pop()
+            clock.now = when
+            fired.append(kind)
+        
+        assert fired == [0, 0, 1, 0, 0]
+    
+    def test_delay_overrides_first_deadline(self, scheduler):
+        """Test that delay sets the first occurrence.
+
+        Args:
+            scheduler: The scheduler fixture.
+        """
+        scheduler.schedule(0, 5.0, delay=0.0)
+        assert scheduler.next_deadline() == 0.0
+    
+    def test_ties_fire_lower_kind_first(self, scheduler):
+        """Test that equal deadlines are ordered by kind.
+
+        Args:
+            scheduler: The scheduler fixture.
+        """
+        scheduler.schedule(2, 1.0)
+        scheduler.schedule(1, 1.0)
+        
+        assert scheduler.pop()[1] == 1
+        assert scheduler.pop()[1] == 2
+    
+    def test_late_event_does_not_burst(self, scheduler, clock):
+        """Test that an event far behind is rescheduled from now.
+
+        Args:
+            scheduler: The scheduler fixture.
+            clock: The fake clock fixture.
+        """
+        scheduler.schedule(0, 1.0)
+        clock.now = 10.0
+        
+        scheduler.pop()
+        
+        assert scheduler.next_deadline() == 11.0
+    
+    def test_wait_returns_due_kind(self):
+        """Test waiting on the real clock returns the earliest event."""
+        scheduler = EventScheduler()
+        scheduler.schedule(0, 0.05)
+        scheduler.schedule(1, 0.01)
+        
+        assert asyncio.run(scheduler.wait()) == 1
+        assert len(scheduler) == 2